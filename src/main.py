@@ -5,11 +5,15 @@ Scans K8s clusters for security misconfigurations
 """
 
 import click
-from kubernetes import client, config
 from colorama import init, Fore, Style
+import concurrent.futures
+import functools
+import io
+import itertools
+import orjson
 import sys
 import os
-import json
+from collections import defaultdict
 from datetime import datetime
 
 # Add src directory to path
@@ -17,12 +21,68 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.utils.scanner_manager import ScannerManager
 from src.utils.scoring import SecurityScorer
+from src.utils.pod_view import PodView
 from src.utils.compliance import ComplianceMapper
-from src.reports.table_reporter import TableReporter
-from src.reports.json_reporter import JSONReporter
 
-# Initialize colorama
-init(autoreset=True)
+# The kubernetes package costs ~250ms to import and the reporters pull
+# in tabulate - both are deferred into the functions that need them so
+# --help and argument errors don't pay for a scan that never happens.
+
+# Initialize colorama - strip escape sequences entirely when stdout is
+# piped (CI, --output json redirects) or NO_COLOR is set, so
+# non-interactive runs don't pay for ANSI generation and filtering
+init(autoreset=True,
+     strip=(not sys.stdout.isatty()) or bool(os.environ.get('NO_COLOR')))
+
+# Severity levels in display/merge order
+_SEVERITIES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+
+# Static display tables - built once at import instead of per report
+_SEVERITY_COLORS = {
+    'CRITICAL': Fore.RED,
+    'HIGH': Fore.YELLOW,
+    'MEDIUM': Fore.BLUE,
+    'LOW': Fore.WHITE
+}
+
+_SEVERITY_ICONS = {
+    'CRITICAL': '🚨',
+    'HIGH': '⚠️ ',
+    'MEDIUM': '🔵',
+    'LOW': 'ℹ️ '
+}
+
+# Horizontal rule used between report sections - built once
+_RULE = '=' * 60
+_HR = f"{Fore.CYAN}{_RULE}{Style.RESET_ALL}"
+
+_BANNER = f"""
+{Fore.CYAN}╔══════════════════════════════════════════════════════════╗
+║                                                          ║
+║        🔒 KUBERNETES SECURITY SCANNER v1.0 🔒           ║
+║                                                          ║
+║     Detect security misconfigurations in K8s clusters   ║
+║                                                          ║
+╚══════════════════════════════════════════════════════════╝{Style.RESET_ALL}
+"""
+
+
+# Shared helper instances - constructing the 20 scanners (and the
+# scorer/mapper tables) once per process amortizes startup cost across
+# repeated invocations in tests or CLI loops
+@functools.lru_cache(maxsize=1)
+def _scanner_mgr():
+    return ScannerManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _scorer():
+    return SecurityScorer()
+
+
+@functools.lru_cache(maxsize=1)
+def _mapper():
+    return ComplianceMapper()
 
 
 @click.command()
@@ -46,7 +106,8 @@ def scan(namespace, output, all_namespaces, detailed, save, fail_on_critical, mi
     """
     Scan Kubernetes cluster for security issues
     """
-    
+    from kubernetes import client, config
+
     # Print banner (skip for JSON output)
     if output != 'json':
         print_banner()
@@ -54,88 +115,97 @@ def scan(namespace, output, all_namespaces, detailed, save, fail_on_critical, mi
     try:
         # Load Kubernetes configuration
         config.load_kube_config()
-        v1 = client.CoreV1Api()
+
+        # Widen the urllib3 connection pool - the default maxsize of 4
+        # would serialize the concurrent namespace scans behind a handful
+        # of sockets on large --all-namespaces runs
+        cfg = client.Configuration.get_default_copy()
+        cfg.connection_pool_maxsize = 64
+        v1 = client.CoreV1Api(api_client=client.ApiClient(configuration=cfg))
         
         # Initialize scanner manager and scorer
-        scanner_mgr = ScannerManager()
-        scorer = SecurityScorer()
+        scanner_mgr = _scanner_mgr()
+        scorer = _scorer()
         
         if output != 'json':
             click.echo(f"{Fore.GREEN}✓ Loaded {scanner_mgr.get_scanner_count()} security scanners{Style.RESET_ALL}\n")
         
-        # Determine namespaces to scan
+        # Determine pods to scan, grouped by namespace
         if all_namespaces:
             if output != 'json':
                 click.echo(f"{Fore.CYAN}📡 Scanning ALL namespaces...{Style.RESET_ALL}\n")
-            namespaces = [ns.metadata.name for ns in v1.list_namespace().items]
+            # One cluster-wide LIST instead of a round-trip per namespace -
+            # collapses O(namespaces) HTTPS calls into a single request.
+            pods_by_ns = defaultdict(list)
+            for batch in _list_pods_paged(v1):
+                for pod in batch:
+                    pods_by_ns[pod.metadata.namespace].append(pod)
         else:
             if output != 'json':
                 click.echo(f"{Fore.CYAN}📡 Scanning namespace: {namespace}{Style.RESET_ALL}\n")
-            namespaces = [namespace]
-        
+            try:
+                pods_by_ns = {
+                    namespace: [pod for batch in _list_pods_paged(v1, ns=namespace)
+                                for pod in batch]
+                }
+            except client.exceptions.ApiException as e:
+                pods_by_ns = {}
+                if e.status == 404:
+                    if output != 'json':
+                        click.echo(f"{Fore.RED}✗ Namespace '{namespace}' not found{Style.RESET_ALL}")
+                else:
+                    if output != 'json':
+                        click.echo(f"{Fore.RED}✗ Error accessing namespace '{namespace}': {e}{Style.RESET_ALL}")
+
         # Collect all findings
-        all_results = {
-            'CRITICAL': [],
-            'HIGH': [],
-            'MEDIUM': [],
-            'LOW': []
-        }
+        all_results = {severity: [] for severity in _SEVERITIES}
         total_pods = 0
         pod_scores = []
         
-        # Scan each namespace
-        for ns in namespaces:
-            try:
-                pods = v1.list_namespaced_pod(namespace=ns)
-                
-                if len(pods.items) == 0:
+        # Scan namespaces concurrently and merge results on the main
+        # thread to keep output readable. Workers stay bounded so large
+        # clusters don't spawn an unreasonable number of threads.
+        max_workers = min(32, max(len(pods_by_ns), 1))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_scan_namespace, ns, pods, scanner_mgr, scorer): ns
+                for ns, pods in pods_by_ns.items()
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                ns = futures[future]
+                pod_count, ns_findings, ns_pod_scores = future.result()
+
+                if pod_count == 0:
                     continue
-                
-                total_pods += len(pods.items)
-                
+
+                total_pods += pod_count
+
                 if output != 'json':
-                    click.echo(f"{Fore.GREEN}✓ Found {len(pods.items)} pods in namespace '{ns}'{Style.RESET_ALL}")
-                
-                # Scan all pods in namespace
-                results = scanner_mgr.scan_pods(pods.items)
-                
-                # Calculate pod scores
-                for pod in pods.items:
-                    pod_findings = scanner_mgr.scan_pod(pod)
-                    pod_score = scorer.calculate_pod_score(pod_findings)
-                    pod_scores.append({
-                        'name': pod.metadata.name,
-                        'namespace': ns,
-                        **pod_score
-                    })
-                
+                    click.echo(f"{Fore.GREEN}✓ Found {pod_count} pods in namespace '{ns}'{Style.RESET_ALL}")
+
+                pod_scores.extend(ns_pod_scores)
+
                 # Merge results
-                for severity in all_results.keys():
-                    all_results[severity].extend(
-                        results['findings_by_severity'][severity]
-                    )
-                
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    if output != 'json':
-                        click.echo(f"{Fore.RED}✗ Namespace '{ns}' not found{Style.RESET_ALL}")
-                else:
-                    if output != 'json':
-                        click.echo(f"{Fore.RED}✗ Error accessing namespace '{ns}': {e}{Style.RESET_ALL}")
-                continue
+                for severity in _SEVERITIES:
+                    all_results[severity].extend(ns_findings[severity])
         
-        # Calculate overall scores
-        all_findings_list = (all_results['CRITICAL'] + all_results['HIGH'] + 
-                            all_results['MEDIUM'] + all_results['LOW'])
+        # Materialize the combined findings exactly once (severity order
+        # preserved) - the scorer, mapper and reporters all share this list
+        all_findings_list = list(itertools.chain.from_iterable(
+            all_results[severity] for severity in _SEVERITIES
+        ))
         
         overall_score = scorer.calculate_pod_score(all_findings_list)
         
         # Get compliance data
-        mapper = ComplianceMapper()
+        mapper = _mapper()
         compliance_data = mapper.analyze_compliance(all_findings_list)
         
         # Handle output format
         if output == 'json':
+            from src.reports.json_reporter import JSONReporter
+
             json_reporter = JSONReporter(
                 all_findings_list,
                 pod_scores,
@@ -145,10 +215,14 @@ def scan(namespace, output, all_namespaces, detailed, save, fail_on_critical, mi
                 total_pods
             )
             
-            report = json_reporter.generate_report()
-            
-            # Print JSON to stdout
-            print(json.dumps(report, indent=2))
+            # Stream the report to stdout - the findings array is
+            # serialized one element at a time instead of materializing
+            # the whole document as a second giant string
+            out = sys.stdout.buffer
+            for chunk in json_reporter.iter_report():
+                out.write(chunk)
+            out.write(b'\n')
+            out.flush()
             
             # Save to file if requested
             if save:
@@ -175,10 +249,12 @@ def scan(namespace, output, all_namespaces, detailed, save, fail_on_critical, mi
                 )
             else:
                 print_results(all_results, total_pods, overall_score, scorer)
-                print_compliance_summary(all_results)
+                print_compliance_summary(compliance_data)
             
             # Save to file if requested
             if save:
+                from src.reports.table_reporter import TableReporter
+
                 reporter = TableReporter(all_findings_list)
                 content = generate_full_report(
                     all_results, total_pods, overall_score,
@@ -207,88 +283,175 @@ def scan(namespace, output, all_namespaces, detailed, save, fail_on_critical, mi
         sys.exit(1)
 
 
+def _list_pods_paged(v1, ns=None, page=500, field_selector=None):
+    """
+    List pods in pages using the limit/continue API
+
+    Unbounded LIST calls make the apiserver build one giant response,
+    which spikes memory on both ends at thousands of pods. Chunked
+    listing keeps each response (and our decode cost) bounded.
+
+    The raw response is parsed with orjson and wrapped in PodView
+    instead of being deserialized into swagger model objects - model
+    construction is the dominant per-pod decode cost and the scanners
+    only read a handful of fields.
+
+    Args:
+        v1: CoreV1Api client
+        ns: Namespace to list, or None for all namespaces
+        page: Page size per request
+        field_selector: Optional server-side filter, e.g.
+            "spec.nodeName=<node>" for DaemonSet-style node-local
+            scans - the apiserver then never ships the other pods
+
+    Yields:
+        Lists of PodView objects, one list per page
+    """
+    # Bind the list call once instead of resolving it per page
+    if ns is None:
+        list_page = functools.partial(v1.list_pod_for_all_namespaces, watch=False)
+    else:
+        list_page = functools.partial(v1.list_namespaced_pod, namespace=ns)
+    if field_selector:
+        list_page = functools.partial(list_page, field_selector=field_selector)
+
+    token = None
+    while True:
+        kwargs = {'limit': page, '_preload_content': False}
+        if token:
+            kwargs['_continue'] = token
+        else:
+            # First page: resourceVersion=0 lets the apiserver answer
+            # from its in-memory watch cache instead of reading etcd.
+            # Continuation pages carry their own resourceVersion.
+            kwargs['resource_version'] = '0'
+            kwargs['resource_version_match'] = 'NotOlderThan'
+
+        resp = list_page(**kwargs)
+
+        data = orjson.loads(resp.data)
+
+        # A metadata-only LIST (PartialObjectMetadataList) would be
+        # far smaller but drops spec, which every scanner reads, so
+        # full objects stay. managedFields is the one large section
+        # nothing here uses - discard it so pods retained for the
+        # scan phase don't keep it alive.
+        items = data.get('items', [])
+        for item in items:
+            metadata = item.get('metadata')
+            if metadata is not None:
+                metadata.pop('managedFields', None)
+
+        yield [PodView(item) for item in items]
+
+        token = (data.get('metadata') or {}).get('continue')
+        if not token:
+            break
+
+
+def _scan_namespace(ns, pods, scanner_mgr, scorer):
+    """
+    Scan all pods belonging to a single namespace
+
+    Runs on a worker thread - must not touch stdout. Scanning, per-pod
+    scoring and severity bucketing happen in one fused pass so each
+    pod and its findings are traversed exactly once.
+
+    Args:
+        ns: Namespace name
+        pods: List of pod objects in that namespace
+
+    Returns:
+        Tuple of (pod_count, findings by severity, per-pod scores)
+    """
+    if not (pod_count := len(pods)):
+        return 0, None, []
+
+    findings_by_severity = {severity: [] for severity in _SEVERITIES}
+    ns_pod_scores = []
+
+    for pod, findings in scanner_mgr.scan_pods_iter(pods):
+        pod_score = scorer.calculate_pod_score(findings)
+        ns_pod_scores.append({
+            'name': pod.metadata.name,
+            'namespace': ns,
+            **pod_score
+        })
+
+        for finding in findings:
+            findings_by_severity[finding['severity']].append(finding)
+
+    return pod_count, findings_by_severity, ns_pod_scores
+
+
 def print_banner():
     """Print ASCII banner"""
-    banner = f"""
-{Fore.CYAN}╔══════════════════════════════════════════════════════════╗
-║                                                          ║
-║        🔒 KUBERNETES SECURITY SCANNER v1.0 🔒           ║
-║                                                          ║
-║     Detect security misconfigurations in K8s clusters   ║
-║                                                          ║
-╚══════════════════════════════════════════════════════════╝{Style.RESET_ALL}
-"""
-    click.echo(banner)
+    click.echo(_BANNER)
 
 
 def print_results(findings_by_severity, total_pods, overall_score, scorer):
     """Print standard scan results"""
-    
-    total_findings = sum(len(findings) for findings in findings_by_severity.values())
-    
-    click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}📊 SCAN RESULTS{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
-    
-    click.echo(f"Total pods scanned: {total_pods}")
-    click.echo(f"Total issues found: {total_findings}\n")
-    
-    severity_colors = {
-        'CRITICAL': Fore.RED,
-        'HIGH': Fore.YELLOW,
-        'MEDIUM': Fore.BLUE,
-        'LOW': Fore.WHITE
-    }
-    
-    severity_icons = {
-        'CRITICAL': '🚨',
-        'HIGH': '⚠️ ',
-        'MEDIUM': '🔵',
-        'LOW': 'ℹ️ '
-    }
-    
-    for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
+
+    # The scorer already counted every finding in its single pass -
+    # reuse that instead of re-walking the severity buckets
+    total_findings = overall_score['findings_count']
+
+    # Build the whole report in one buffer and emit it with a single
+    # echo - per-line echo locks and flushes stdout for every finding
+    buf = io.StringIO()
+    out = buf.write
+
+    out(f"\n{_HR}\n")
+    out(f"{Fore.YELLOW}📊 SCAN RESULTS{Style.RESET_ALL}\n")
+    out(f"{_HR}\n\n")
+
+    out(f"Total pods scanned: {total_pods}\n")
+    out(f"Total issues found: {total_findings}\n\n")
+
+    for severity in _SEVERITIES:
         findings = findings_by_severity[severity]
         count = len(findings)
-        
+
         if count > 0:
-            color = severity_colors[severity]
-            icon = severity_icons[severity]
-            
-            click.echo(f"{color}{icon} {severity} Issues: {count}{Style.RESET_ALL}")
-            
+            color = _SEVERITY_COLORS[severity]
+            icon = _SEVERITY_ICONS[severity]
+
+            out(f"{color}{icon} {severity} Issues: {count}{Style.RESET_ALL}\n")
+
             for finding in findings[:3]:
-                click.echo(f"  {color}├─{Style.RESET_ALL} {finding['pod_name']}/{finding['container_name']}")
-                click.echo(f"  {color}│{Style.RESET_ALL}  {finding['issue']}")
-            
+                out(f"  {color}├─{Style.RESET_ALL} {finding['pod_name']}/{finding['container_name']}\n")
+                out(f"  {color}│{Style.RESET_ALL}  {finding['issue']}\n")
+
             if count > 3:
-                click.echo(f"  {color}└─{Style.RESET_ALL} ... and {count - 3} more")
-            
-            click.echo()
-    
+                out(f"  {color}└─{Style.RESET_ALL} ... and {count - 3} more\n")
+
+            out('\n')
+
     score = overall_score['score']
     grade = overall_score['grade']
     risk_level = overall_score['risk_level']
-    
+
     if score >= 80:
         score_color = Fore.GREEN
     elif score >= 60:
         score_color = Fore.YELLOW
     else:
         score_color = Fore.RED
-    
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    click.echo(f"{score_color}Security Score: {score}/100 (Grade: {grade}){Style.RESET_ALL}")
-    click.echo(f"{score_color}Risk Level: {risk_level}{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
-    
+
+    out(f"{_HR}\n")
+    out(f"{score_color}Security Score: {score}/100 (Grade: {grade}){Style.RESET_ALL}\n")
+    out(f"{score_color}Risk Level: {risk_level}{Style.RESET_ALL}\n")
+    out(f"{_HR}\n\n")
+
     recommendations = scorer.get_recommendations(score, overall_score['severity_breakdown'])
-    
+
     if recommendations:
-        click.echo(f"{Fore.YELLOW}📋 Recommendations:{Style.RESET_ALL}")
+        out(f"{Fore.YELLOW}📋 Recommendations:{Style.RESET_ALL}\n")
         for rec in recommendations:
-            click.echo(f"  {rec}")
-        click.echo()
+            out(f"  {rec}\n")
+        out('\n')
+
+    click.echo(buf.getvalue(), nl=False)
 
 
 def print_detailed_results(
@@ -296,76 +459,87 @@ def print_detailed_results(
     pod_scores, compliance_data, all_findings
 ):
     """Print detailed results with tables"""
-    
+    from src.reports.table_reporter import TableReporter
+
     reporter = TableReporter(all_findings)
-    
-    click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}📊 DETAILED SCAN RESULTS{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    
-    click.echo(reporter.generate_summary_table())
-    click.echo(reporter.generate_findings_table(max_rows=30))
-    click.echo(reporter.generate_pod_table(pod_scores))
-    click.echo(reporter.generate_compliance_table(compliance_data))
-    
+
+    buf = io.StringIO()
+    out = buf.write
+
+    out(f"\n{_HR}\n")
+    out(f"{Fore.YELLOW}📊 DETAILED SCAN RESULTS{Style.RESET_ALL}\n")
+    out(f"{_HR}\n")
+
+    out(reporter.generate_summary_table())
+    out('\n')
+    out(reporter.generate_findings_table(max_rows=30))
+    out('\n')
+    out(reporter.generate_pod_table(pod_scores))
+    out('\n')
+    out(reporter.generate_compliance_table(compliance_data))
+    out('\n')
+
     score = overall_score['score']
     grade = overall_score['grade']
     risk_level = overall_score['risk_level']
-    
+
     if score >= 80:
         score_color = Fore.GREEN
     elif score >= 60:
         score_color = Fore.YELLOW
     else:
         score_color = Fore.RED
-    
-    click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    click.echo(f"{score_color}Overall Security Score: {score}/100 (Grade: {grade}){Style.RESET_ALL}")
-    click.echo(f"{score_color}Risk Level: {risk_level}{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
 
+    out(f"\n{_HR}\n")
+    out(f"{score_color}Overall Security Score: {score}/100 (Grade: {grade}){Style.RESET_ALL}\n")
+    out(f"{score_color}Risk Level: {risk_level}{Style.RESET_ALL}\n")
+    out(f"{_HR}\n\n")
+
+    click.echo(buf.getvalue(), nl=False)
+
+
+def print_compliance_summary(compliance):
+    """
+    Print compliance framework summary
+
+    Args:
+        compliance: Analysis from ComplianceMapper.analyze_compliance
+    """
+    mapper = _mapper()
 
-def print_compliance_summary(findings_by_severity):
-    """Print compliance framework summary"""
-    mapper = ComplianceMapper()
-    
-    all_findings = []
-    for findings in findings_by_severity.values():
-        all_findings.extend(findings)
-    
-    if not all_findings:
-        return
-    
-    compliance = mapper.analyze_compliance(all_findings)
-    
     if compliance['total_frameworks_affected'] == 0:
         return
-    
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}📋 COMPLIANCE SUMMARY{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
-    
+
+    buf = io.StringIO()
+    out = buf.write
+
+    out(f"{_HR}\n")
+    out(f"{Fore.YELLOW}📋 COMPLIANCE SUMMARY{Style.RESET_ALL}\n")
+    out(f"{_HR}\n\n")
+
     for framework, data in compliance['framework_scores'].items():
         full_name = mapper.get_framework_name(framework)
         pct = data['compliance_percentage']
         status = data['status']
-        
+
         if status == 'COMPLIANT':
             color = Fore.GREEN
         elif status == 'MOSTLY_COMPLIANT':
             color = Fore.YELLOW
         else:
             color = Fore.RED
-        
-        click.echo(f"{color}{framework}{Style.RESET_ALL} - {full_name}")
-        click.echo(f"  Compliance: {color}{pct}%{Style.RESET_ALL} ({status})")
-        click.echo(f"  Violations: {data['total_violations']} "
-                   f"(Critical: {data['critical_violations']}, "
-                   f"High: {data['high_violations']})")
-        click.echo()
-    
-    click.echo(f"{Fore.YELLOW}💡 Run with --detailed for enhanced tables{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}💡 Run with --output html for visual report{Style.RESET_ALL}\n")
+
+        out(f"{color}{framework}{Style.RESET_ALL} - {full_name}\n")
+        out(f"  Compliance: {color}{pct}%{Style.RESET_ALL} ({status})\n")
+        out(f"  Violations: {data['total_violations']} "
+            f"(Critical: {data['critical_violations']}, "
+            f"High: {data['high_violations']})\n")
+        out('\n')
+
+    out(f"{Fore.YELLOW}💡 Run with --detailed for enhanced tables{Style.RESET_ALL}\n")
+    out(f"{Fore.YELLOW}💡 Run with --output html for visual report{Style.RESET_ALL}\n\n")
+
+    click.echo(buf.getvalue(), nl=False)
 
 
 def generate_full_report(
@@ -376,7 +550,7 @@ def generate_full_report(
     
     report_parts = [
         "KUBERNETES SECURITY SCAN REPORT",
-        "=" * 60,
+        _RULE,
         "",
         f"Total pods scanned: {total_pods}",
         f"Total issues found: {len(all_findings)}",
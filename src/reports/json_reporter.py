@@ -3,9 +3,16 @@ JSON Reporter
 Generates JSON output for CI/CD integration
 """
 
-import json
-from typing import List, Dict, Any
-from datetime import datetime
+import orjson
+import time
+from typing import List, Dict, Any, Iterator
+from zlib import crc32
+from collections import Counter
+
+from src.scanners.base_scanner import render_text
+
+# Summary severity keys, fixed at import instead of rebuilt per report
+_SEV_KEYS_LOWER = ('critical', 'high', 'medium', 'low')
 
 
 class JSONReporter:
@@ -39,80 +46,139 @@ class JSONReporter:
         self.compliance_data = compliance_data
         self.namespace = namespace
         self.total_pods = total_pods
+        self._report_cache = None
     
     def generate_report(self) -> Dict[str, Any]:
         """
         Generate complete JSON report
-        
+
+        The result is cached, so the typical CI flow (print, save to
+        file, compute exit code) builds the report only once.
+
         Returns:
             Dictionary containing full report
         """
-        # Count findings by severity
+        if self._report_cache is None:
+            self._report_cache = {
+                'metadata': self._build_metadata(),
+                'summary': self._build_summary(),
+                'findings': self._format_findings(),
+                'pod_scores': self._format_pod_scores(),
+                'compliance': self._format_compliance(),
+                'recommendations': self._generate_recommendations()
+            }
+        return self._report_cache
+
+    def invalidate(self):
+        """Drop the cached report after mutating findings"""
+        self._report_cache = None
+
+    def iter_report(self) -> Iterator[bytes]:
+        """
+        Stream the report as indented JSON byte chunks
+
+        Serializes the findings array one element at a time, so the
+        report never exists as both a full Python structure and one
+        giant encoded string simultaneously. Yields the same document
+        generate_report + dumps would produce.
+        """
+        def section(value, depth):
+            # orjson indents from column zero; shift nested lines to
+            # the right depth inside the enclosing document
+            raw = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+            return raw.replace(b'\n', b'\n' + b'  ' * depth)
+
+        yield b'{\n  "metadata": ' + section(self._build_metadata(), 1) + b',\n'
+        yield b'  "summary": ' + section(self._build_summary(), 1) + b',\n'
+
+        if self.findings:
+            yield b'  "findings": [\n'
+            last = len(self.findings) - 1
+            for i, finding in enumerate(self.findings):
+                tail = b',\n' if i != last else b'\n'
+                yield b'    ' + section(self._format_finding(finding), 2) + tail
+            yield b'  ],\n'
+        else:
+            yield b'  "findings": [],\n'
+
+        yield b'  "pod_scores": ' + section(self._format_pod_scores(), 1) + b',\n'
+        yield b'  "compliance": ' + section(self._format_compliance(), 1) + b',\n'
+        yield b'  "recommendations": ' + section(self._generate_recommendations(), 1) + b'\n'
+        yield b'}'
+
+    def _build_metadata(self) -> Dict[str, Any]:
+        """Build the report metadata section"""
+        # strftime on a struct_time is several times cheaper than
+        # datetime.utcnow().isoformat() and matters when reports are
+        # emitted per pod in streaming mode
+        return {
+            'scan_date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'scanner_version': '1.0.0',
+            'namespace': self.namespace,
+            'total_pods_scanned': self.total_pods,
+            'total_issues_found': len(self.findings)
+        }
+
+    def _build_summary(self) -> Dict[str, Any]:
+        """Build the report summary section"""
+        # Count findings by severity in a single C-level pass
+        counts = Counter(
+            f.get('severity', 'LOW').lower() for f in self.findings
+        )
         severity_counts = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0
+            key: counts.get(key, 0)
+            for key in _SEV_KEYS_LOWER
         }
-        
-        for finding in self.findings:
-            severity = finding.get('severity', 'LOW').lower()
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        # Build report structure
-        report = {
-            'metadata': {
-                'scan_date': datetime.utcnow().isoformat() + 'Z',
-                'scanner_version': '1.0.0',
-                'namespace': self.namespace,
-                'total_pods_scanned': self.total_pods,
-                'total_issues_found': len(self.findings)
-            },
-            'summary': {
-                'security_score': self.overall_score['score'],
-                'grade': self.overall_score['grade'],
-                'risk_level': self.overall_score['risk_level'],
-                'findings_count': len(self.findings),
-                'severity_breakdown': severity_counts,
-                'pods_analyzed': len(self.pod_scores),
-                'pass': self._determine_pass_fail()
+
+        return {
+            'security_score': self.overall_score['score'],
+            'grade': self.overall_score['grade'],
+            'risk_level': self.overall_score['risk_level'],
+            'findings_count': len(self.findings),
+            'severity_breakdown': severity_counts,
+            'pods_analyzed': len(self.pod_scores),
+            'pass': self._determine_pass_fail()
+        }
+
+    def _format_finding(self, finding: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a single finding for JSON output
+
+        IDs use crc32 instead of Python's salted hash(), so they are
+        stable across processes and usable for diffing reports in CI.
+
+        orjson could serialize the Finding dataclass directly, but the
+        report schema nests the pod fields and the lazy description/
+        remediation pairs must be rendered first, so this reshaping
+        dict is built instead - it is also what keeps every value
+        JSON-native by the time orjson sees it.
+
+        create_finding guarantees every field, so this hot loop
+        indexes directly instead of paying .get dispatch per key.
+        """
+        return {
+            'id': f"{finding['pod_name']}-{finding['container_name']}-{crc32(finding['issue'].encode('utf-8')) & 0xFFFF}",
+            'severity': finding['severity'],
+            'category': finding['category'],
+            'issue': finding['issue'],
+            'description': render_text(finding['description']),
+            'remediation': render_text(finding['remediation']),
+            'pod': {
+                'name': finding['pod_name'],
+                'namespace': finding['namespace'],
+                'container': finding['container_name']
             },
-            'findings': self._format_findings(),
-            'pod_scores': self._format_pod_scores(),
-            'compliance': self._format_compliance(),
-            'recommendations': self._generate_recommendations()
+            'compliance': finding['compliance']
         }
-        
-        return report
-    
+
     def _format_findings(self) -> List[Dict[str, Any]]:
         """Format findings for JSON output"""
-        formatted = []
-        
-        for finding in self.findings:
-            formatted.append({
-                'id': f"{finding['pod_name']}-{finding['container_name']}-{hash(finding['issue']) % 10000}",
-                'severity': finding.get('severity', 'LOW'),
-                'category': finding.get('category', 'unknown'),
-                'issue': finding['issue'],
-                'description': finding.get('description', ''),
-                'remediation': finding.get('remediation', ''),
-                'pod': {
-                    'name': finding['pod_name'],
-                    'namespace': finding['namespace'],
-                    'container': finding['container_name']
-                },
-                'compliance': finding.get('compliance', [])
-            })
-        
-        return formatted
+        return [self._format_finding(finding) for finding in self.findings]
     
     def _format_pod_scores(self) -> List[Dict[str, Any]]:
         """Format pod scores for JSON output"""
-        formatted = []
-        
-        for pod_data in self.pod_scores:
-            formatted.append({
+        return [
+            {
                 'name': pod_data['name'],
                 'namespace': pod_data['namespace'],
                 'security_score': pod_data['score'],
@@ -120,25 +186,24 @@ class JSONReporter:
                 'risk_level': pod_data['risk_level'],
                 'findings_count': pod_data['findings_count'],
                 'severity_breakdown': pod_data['severity_breakdown']
-            })
-        
-        return formatted
-    
+            }
+            for pod_data in self.pod_scores
+        ]
+
     def _format_compliance(self) -> Dict[str, Any]:
         """Format compliance data for JSON output"""
         framework_scores = self.compliance_data.get('framework_scores', {})
-        
-        formatted = {}
-        for framework, data in framework_scores.items():
-            formatted[framework] = {
+
+        return {
+            framework: {
                 'compliance_percentage': data['compliance_percentage'],
                 'status': data['status'],
                 'total_violations': data['total_violations'],
                 'critical_violations': data['critical_violations'],
                 'high_violations': data['high_violations']
             }
-        
-        return formatted
+            for framework, data in framework_scores.items()
+        }
     
     def _generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generate prioritized recommendations"""
@@ -195,20 +260,51 @@ class JSONReporter:
         
         return True
     
+    # Above this many findings, save_to_file streams instead of holding
+    # the whole report dict and its encoded string in memory at once
+    _STREAM_THRESHOLD = 10_000
+
     def save_to_file(self, filename: str) -> bool:
         """
         Save JSON report to file
-        
+
         Args:
             filename: Output filename
-            
+
         Returns:
             True if successful
         """
+        if len(self.findings) > self._STREAM_THRESHOLD:
+            return self.save_to_file_streaming(filename)
         try:
             report = self.generate_report()
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            # orjson emits UTF-8 bytes straight to the binary file -
+            # no str encode step and no ensure_ascii escaping pass
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            return True
+        except Exception as e:
+            print(f"Error saving JSON file: {e}")
+            return False
+
+    def save_to_file_streaming(self, filename: str) -> bool:
+        """
+        Save JSON report to file one chunk at a time
+
+        Writes the same document as save_to_file but serializes the
+        findings array incrementally, keeping extra memory constant
+        regardless of how many findings the scan produced.
+
+        Args:
+            filename: Output filename
+
+        Returns:
+            True if successful
+        """
+        try:
+            with open(filename, 'wb') as f:
+                for chunk in self.iter_report():
+                    f.write(chunk)
             return True
         except Exception as e:
             print(f"Error saving JSON file: {e}")
@@ -3,9 +3,130 @@ Table Reporter
 Generates formatted terminal output with tables
 """
 
+import heapq
+import re
 from typing import List, Dict, Any
+from collections import Counter
+from operator import itemgetter
 from tabulate import tabulate
-from colorama import Fore, Style
+from colorama import just_fix_windows_console
+
+# Enables ANSI handling on Windows terminals without wrapping every
+# Fore/Style attribute access in colorama proxy objects
+just_fix_windows_console()
+
+# Raw ANSI codes - plain str constants, no per-cell attribute lookups
+_RED = '\x1b[31m'
+_GRN = '\x1b[32m'
+_YEL = '\x1b[33m'
+_BLU = '\x1b[34m'
+_CYN = '\x1b[36m'
+_WHT = '\x1b[37m'
+_RST = '\x1b[0m'
+
+# Severity tables built once at import - every report reuses them
+_SEVERITIES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+_SEV_COLOR = {'CRITICAL': _RED, 'HIGH': _YEL, 'MEDIUM': _BLU, 'LOW': _WHT}
+
+# All 21 possible bar strings (0-20 blocks), built once at import
+_BARS = tuple('█' * i for i in range(21))
+
+# Compiled once - save_to_file strips color codes on every call
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI color/style escape sequences from text"""
+    return _ANSI_RE.sub('', text)
+
+
+def _render_grid(headers, rows) -> str:
+    """
+    Render a fixed-column table in tabulate's 'grid' style
+
+    tabulate is general-purpose and formats cell by cell in pure
+    Python; for the small fixed layouts used here, one width-measuring
+    pass plus str.join renders the same grid several times faster.
+
+    Args:
+        headers: Column header strings
+        rows: Sequence of row sequences (cells may be str or numbers)
+
+    Returns:
+        Formatted table string
+    """
+    cells = [[cell if isinstance(cell, str) else str(cell) for cell in row]
+             for row in rows]
+    # Measure widths against ANSI-stripped text so colored cells align
+    plain = [[strip_ansi(cell) for cell in row] for row in cells]
+    numeric = [all(isinstance(row[i], (int, float)) for row in rows)
+               for i in range(len(headers))]
+    widths = [
+        max(len(header), max((len(row[i]) for row in plain), default=0))
+        for i, header in enumerate(headers)
+    ]
+
+    sep = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+    header_sep = '+' + '+'.join('=' * (w + 2) for w in widths) + '+'
+
+    def render_row(row, row_plain):
+        parts = []
+        for i, (cell, cell_plain) in enumerate(zip(row, row_plain)):
+            pad = ' ' * (widths[i] - len(cell_plain))
+            parts.append(pad + cell if numeric[i] else cell + pad)
+        return '| ' + ' | '.join(parts) + ' |'
+
+    lines = [sep, render_row(headers, headers), header_sep]
+    for row, row_plain in zip(cells, plain):
+        lines.append(render_row(row, row_plain))
+        lines.append(sep)
+
+    return '\n'.join(lines)
+
+
+def _compose(sections) -> str:
+    """
+    Join (title, body) report sections into one string
+
+    One join replaces the per-section f-string concatenation, halving
+    the temporary strings allocated when composing multi-table output.
+
+    Args:
+        sections: Sequence of (title, body) string pairs
+
+    Returns:
+        Combined report text with colored titles
+    """
+    return '\n' + '\n\n'.join(
+        f"{_CYN}{title}{_RST}\n{body}" for title, body in sections
+    )
+
+
+def _row_for(i, finding, colors):
+    """
+    Build one findings-table row as a 5-element list
+
+    Single pass over the finding dict - severity lookup, color,
+    truncation and defaults all happen here on local variables
+    rather than spread across the table-building loop.
+
+    Args:
+        i: 1-based row number
+        finding: Finding dictionary
+        colors: Severity-to-ANSI-color mapping
+
+    Returns:
+        Row list of [#, colored severity, pod, container, issue]
+    """
+    severity = finding.get('severity', 'LOW')
+    s = finding.get('issue', 'Unknown')
+    return [
+        i,
+        f"{colors[severity]}{severity}{_RST}",
+        finding.get('pod_name', 'Unknown'),
+        finding.get('container_name', 'Unknown'),
+        s if len(s) <= 50 else s[:47] + '...'
+    ]
 
 
 class TableReporter:
@@ -21,12 +142,19 @@ class TableReporter:
             findings: List of all findings
         """
         self.findings = findings
-        self.severity_colors = {
-            'CRITICAL': Fore.RED,
-            'HIGH': Fore.YELLOW,
-            'MEDIUM': Fore.BLUE,
-            'LOW': Fore.WHITE
-        }
+        # Count once at construction - Counter consumes the generator in
+        # C, and every generate_* call reuses the same tallies
+        self.severity_counts = Counter(
+            f.get('severity', 'LOW') for f in findings
+        )
+        self.category_counts = Counter(
+            f.get('category', 'unknown') for f in findings
+        )
+        # Findings carry their integer severity rank from creation, so
+        # the findings sort runs on itemgetter entirely in C; the
+        # sorted list is cached across generate_findings_table calls
+        self._sorted_findings = None
+        self.severity_colors = _SEV_COLOR
     
     def generate_summary_table(self) -> str:
         """
@@ -35,38 +163,22 @@ class TableReporter:
         Returns:
             Formatted table string
         """
-        # Count by severity
-        severity_counts = {
-            'CRITICAL': 0,
-            'HIGH': 0,
-            'MEDIUM': 0,
-            'LOW': 0
-        }
-        
-        # Count by category
-        category_counts = {}
-        
-        for finding in self.findings:
-            severity = finding.get('severity', 'LOW')
-            category = finding.get('category', 'unknown')
-            
-            severity_counts[severity] += 1
-            category_counts[category] = category_counts.get(category, 0) + 1
-        
+        severity_counts = self.severity_counts
+        category_counts = self.category_counts
+
         # Create severity table
         severity_data = []
-        for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
+        for severity in _SEVERITIES:
             count = severity_counts[severity]
             color = self.severity_colors[severity]
             
             # Add visual bar
-            bar_length = min(count, 20)
-            bar = '█' * bar_length
+            bar = _BARS[min(count, 20)]
             
             severity_data.append([
-                f"{color}{severity}{Style.RESET_ALL}",
+                f"{color}{severity}{_RST}",
                 count,
-                f"{color}{bar}{Style.RESET_ALL}"
+                f"{color}{bar}{_RST}"
             ])
         
         severity_table = tabulate(
@@ -87,7 +199,10 @@ class TableReporter:
             tablefmt='grid'
         )
         
-        return f"\n{Fore.CYAN}Findings by Severity:{Style.RESET_ALL}\n{severity_table}\n\n{Fore.CYAN}Findings by Category:{Style.RESET_ALL}\n{category_table}"
+        return _compose([
+            ('Findings by Severity:', severity_table),
+            ('Findings by Category:', category_table)
+        ])
     
     def generate_findings_table(self, max_rows: int = 20) -> str:
         """
@@ -99,54 +214,43 @@ class TableReporter:
         Returns:
             Formatted table string
         """
-        if not self.findings:
-            return f"{Fore.GREEN}No security issues found! ✓{Style.RESET_ALL}"
-        
-        # Sort by severity (CRITICAL first)
-        severity_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        sorted_findings = sorted(
-            self.findings,
-            key=lambda x: severity_order.get(x.get('severity', 'LOW'), 4)
-        )
-        
-        # Limit rows
-        display_findings = sorted_findings[:max_rows]
-        
-        # Create table data
-        table_data = []
-        for i, finding in enumerate(display_findings, 1):
-            severity = finding.get('severity', 'LOW')
-            color = self.severity_colors[severity]
-            
-            # Truncate long issues
-            issue = finding.get('issue', 'Unknown')
-            if len(issue) > 50:
-                issue = issue[:47] + '...'
-            
-            pod = finding.get('pod_name', 'Unknown')
-            container = finding.get('container_name', 'Unknown')
-            
-            table_data.append([
-                i,
-                f"{color}{severity}{Style.RESET_ALL}",
-                pod,
-                container,
-                issue
-            ])
+        findings = self.findings
+        if not findings:
+            return f"{_GRN}No security issues found! ✓{_RST}"
+
+        # Select the top rows by severity (CRITICAL first). On large
+        # finding lists a heap-based partial selection is O(N log K)
+        # against the full sort's O(N log N); small lists sort fully
+        # and cache for repeat calls.
+        if self._sorted_findings is not None:
+            display_findings = self._sorted_findings[:max_rows]
+        elif len(findings) > 4 * max_rows:
+            display_findings = heapq.nsmallest(
+                max_rows, findings, key=itemgetter('_rank')
+            )
+        else:
+            self._sorted_findings = sorted(findings, key=itemgetter('_rank'))
+            display_findings = self._sorted_findings[:max_rows]
         
-        table = tabulate(
-            table_data,
-            headers=['#', 'Severity', 'Pod', 'Container', 'Issue'],
-            tablefmt='grid'
+        # Build all rows in one comprehension pass
+        colors = self.severity_colors
+        table_data = [
+            _row_for(i, finding, colors)
+            for i, finding in enumerate(display_findings, 1)
+        ]
+
+        table = _render_grid(
+            ['#', 'Severity', 'Pod', 'Container', 'Issue'],
+            table_data
         )
         
-        result = f"\n{Fore.CYAN}Top {len(display_findings)} Findings:{Style.RESET_ALL}\n{table}"
-        
-        if len(sorted_findings) > max_rows:
-            remaining = len(sorted_findings) - max_rows
-            result += f"\n\n{Fore.YELLOW}... and {remaining} more issues{Style.RESET_ALL}"
-        
-        return result
+        parts = [_compose([(f'Top {len(display_findings)} Findings:', table)])]
+
+        if len(findings) > max_rows:
+            remaining = len(findings) - max_rows
+            parts.append(f"\n\n{_YEL}... and {remaining} more issues{_RST}")
+
+        return ''.join(parts)
     
     def generate_pod_table(self, pod_scores: List[Dict[str, Any]]) -> str:
         """
@@ -173,32 +277,30 @@ class TableReporter:
             
             # Color based on score
             if score >= 80:
-                color = Fore.GREEN
+                color = _GRN
             elif score >= 60:
-                color = Fore.YELLOW
+                color = _YEL
             else:
-                color = Fore.RED
+                color = _RED
             
-            # Create score bar
-            bar_length = int(score / 5)  # 100 / 5 = 20 chars max
-            bar = '█' * bar_length
+            # Create score bar (100 / 5 = 20 chars max)
+            bar = _BARS[int(score / 5)]
             
             table_data.append([
                 pod_data['name'],
-                f"{color}{score}/100{Style.RESET_ALL}",
-                f"{color}{grade}{Style.RESET_ALL}",
+                f"{color}{score}/100{_RST}",
+                f"{color}{grade}{_RST}",
                 risk,
                 findings,
-                f"{color}{bar}{Style.RESET_ALL}"
+                f"{color}{bar}{_RST}"
             ])
         
-        table = tabulate(
-            table_data,
-            headers=['Pod Name', 'Score', 'Grade', 'Risk', 'Issues', 'Score Visual'],
-            tablefmt='grid'
+        table = _render_grid(
+            ['Pod Name', 'Score', 'Grade', 'Risk', 'Issues', 'Score Visual'],
+            table_data
         )
         
-        return f"\n{Fore.CYAN}Per-Pod Security Scores:{Style.RESET_ALL}\n{table}"
+        return _compose([('Per-Pod Security Scores:', table)])
     
     def generate_compliance_table(self, compliance_data: Dict[str, Any]) -> str:
         """
@@ -223,34 +325,32 @@ class TableReporter:
             
             # Color based on compliance
             if status == 'COMPLIANT':
-                color = Fore.GREEN
+                color = _GRN
             elif status == 'MOSTLY_COMPLIANT':
-                color = Fore.YELLOW
+                color = _YEL
             else:
-                color = Fore.RED
+                color = _RED
             
-            # Create compliance bar
-            bar_length = int(pct / 5)  # 100 / 5 = 20 chars max
-            bar = '█' * bar_length
+            # Create compliance bar (100 / 5 = 20 chars max)
+            bar = _BARS[int(pct / 5)]
             
             # Format status
             status_display = status.replace('_', ' ')
             
             table_data.append([
                 framework,
-                f"{color}{pct}%{Style.RESET_ALL}",
-                f"{color}{status_display}{Style.RESET_ALL}",
+                f"{color}{pct}%{_RST}",
+                f"{color}{status_display}{_RST}",
                 violations,
-                f"{color}{bar}{Style.RESET_ALL}"
+                f"{color}{bar}{_RST}"
             ])
         
-        table = tabulate(
-            table_data,
-            headers=['Framework', 'Compliance', 'Status', 'Violations', 'Visual'],
-            tablefmt='grid'
+        table = _render_grid(
+            ['Framework', 'Compliance', 'Status', 'Violations', 'Visual'],
+            table_data
         )
         
-        return f"\n{Fore.CYAN}Compliance Status:{Style.RESET_ALL}\n{table}"
+        return _compose([('Compliance Status:', table)])
     
     def save_to_file(self, filename: str, content: str):
         """
@@ -263,9 +363,7 @@ class TableReporter:
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 # Remove color codes for file output
-                import re
-                clean_content = re.sub(r'\x1b\[[0-9;]*m', '', content)
-                f.write(clean_content)
+                f.write(strip_ansi(content))
             return True
         except Exception as e:
             print(f"Error saving file: {e}")
@@ -6,69 +6,13 @@ Detects containers without MAC (Mandatory Access Control) profiles
 from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
+# AppArmor profiles are declared per container via this annotation prefix
+_APPARMOR_PREFIX = "container.apparmor.security.beta.kubernetes.io/"
 
-class AppArmorSELinuxScanner(BaseScanner):
-    """
-    Scans for missing AppArmor or SELinux profiles
-    
-    MAC provides additional security layer beyond standard permissions.
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if containers use AppArmor or SELinux
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for missing MAC profiles
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            has_apparmor = False
-            has_selinux = False
-            
-            # Check for AppArmor annotation
-            if pod.metadata.annotations:
-                apparmor_key = f"container.apparmor.security.beta.kubernetes.io/{container_name}"
-                if apparmor_key in pod.metadata.annotations:
-                    has_apparmor = True
-            
-            # Check for SELinux context
-            if container.security_context and container.security_context.se_linux_options:
-                has_selinux = True
-            
-            # If neither is set, create finding
-            if not has_apparmor and not has_selinux:
-                findings.append(self._create_mac_finding(
-                    pod_name, namespace, container_name
-                ))
-        
-        return findings
-    
-    def _create_mac_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        container_name: str
-    ) -> Dict[str, Any]:
-        """Create finding for missing MAC profile"""
-        
-        return self.create_finding(
-            severity="LOW",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=container_name,
-            issue="No AppArmor or SELinux profile",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has no MAC profile.
+# Stored on findings as lazy (template, args) pairs - the ~1 KB text is
+# only formatted if a reporter actually renders the finding
+_MAC_DESCRIPTION = """
+Container '{0}' in pod '{1}' has no MAC profile.
 
 MAC (Mandatory Access Control) provides an extra security layer:
 - AppArmor (common on Ubuntu/Debian)
@@ -87,8 +31,9 @@ Without MAC:
 
 Note: This is LOW severity because MAC is defense-in-depth,
 not the primary security control.
-""".strip(),
-            remediation="""
+""".strip()
+
+_MAC_REMEDIATION = """
 Add AppArmor or SELinux profile:
 
 Option 1: AppArmor (Ubuntu/Debian)
@@ -116,12 +61,75 @@ Note: Check your cluster's OS:
 - Ubuntu/Debian → Use AppArmor
 - RHEL/CentOS/Fedora → Use SELinux
 - Other → May support both or neither
-""".strip(),
-            compliance=[
-                "CIS-5.7.2",
-                "Defense-in-Depth"
-            ]
+""".strip()
+
+
+class AppArmorSELinuxScanner(BaseScanner):
+    """
+    Scans for missing AppArmor or SELinux profiles
+    
+    MAC provides additional security layer beyond standard permissions.
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.7.2",
+        "Defense-in-Depth"
+    )
+    
+    def scan(self, pod) -> List[Dict[str, Any]]:
+        """
+        Check if containers use AppArmor or SELinux
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for missing MAC profiles
+        """
+        findings = []
+
+        # Hoist pod-level attribute chains - each dot is a model
+        # __getattr__, and they are loop-invariant across containers
+        metadata = pod.metadata
+        pod_name = metadata.name
+        namespace = metadata.namespace
+        annotations = metadata.annotations or {}
+
+        for container in pod.spec.containers:
+            container_name = container.name
+
+            has_apparmor = (_APPARMOR_PREFIX + container_name) in annotations
+            sc = container.security_context
+            has_selinux = bool(sc and sc.se_linux_options)
+
+            # If neither is set, create finding
+            if not has_apparmor and not has_selinux:
+                findings.append(self._create_mac_finding(
+                    pod_name, namespace, container_name
+                ))
+        
+        return findings
+    
+    def _create_mac_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: str
+    ) -> Dict[str, Any]:
+        """Create finding for missing MAC profile"""
+        
+        return self.create_finding(
+            severity="LOW",
+            pod_name=pod_name,
+            namespace=namespace,
+            container_name=container_name,
+            issue="No AppArmor or SELinux profile",
+            description=(_MAC_DESCRIPTION, (container_name, pod_name)),
+            remediation=_MAC_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
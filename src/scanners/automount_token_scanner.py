@@ -7,53 +7,11 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
-class AutomountTokenScanner(BaseScanner):
-    """
-    Scans for pods that automount service account tokens
-    when they don't need Kubernetes API access
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if pods automount service account tokens unnecessarily
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for automounted tokens
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        # Check if automountServiceAccountToken is explicitly set to false
-        automount = pod.spec.automount_service_account_token
-        
-        # If not explicitly set to false, it defaults to true
-        if automount is None or automount is True:
-            findings.append(self._create_automount_finding(
-                pod_name, namespace
-            ))
-        
-        return findings
-    
-    def _create_automount_finding(
-        self,
-        pod_name: str,
-        namespace: str
-    ) -> Dict[str, Any]:
-        """Create finding for automounted token"""
-        
-        return self.create_finding(
-            severity="MEDIUM",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name="<all>",
-            issue="Service account token automounted",
-            description=f"""
-Pod '{pod_name}' automatically mounts the service account token.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_AUTOMOUNT_DESCRIPTION = """
+Pod '{0}' automatically mounts the service account token.
 
 The token is mounted at:
 /var/run/secrets/kubernetes.io/serviceaccount/token
@@ -72,8 +30,9 @@ Questions to ask:
 - Does my app need to list/create resources?
 
 If answer is NO to all: Disable automounting!
-""".strip(),
-            remediation="""
+""".strip()
+
+_AUTOMOUNT_REMEDIATION = """
 Disable automounting if not needed:
 
 # If app doesn't use Kubernetes API:
@@ -101,12 +60,71 @@ Security guideline:
 2. Disable automounting for those apps
 3. Only enable for apps that need it
 4. Use dedicated service accounts (not default)
-""".strip(),
-            compliance=[
-                "CIS-5.1.6",
-                "Least Privilege"
-            ]
+""".strip()
+
+
+class AutomountTokenScanner(BaseScanner):
+    """
+    Scans for pods that automount service account tokens
+    when they don't need Kubernetes API access
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "rbac"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.1.6",
+        "Least Privilege"
+    )
+    
+    def scan(self, pod) -> List[Dict[str, Any]]:
+        """
+        Check if pods automount service account tokens unnecessarily
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for automounted tokens
+        """
+        metadata = pod.metadata
+        return list(self.check_pod(
+            (metadata.name, metadata.namespace, pod.spec)
+        ))
+
+    def check_pod(self, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one pod for an automounted service account token
+
+        Args:
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings from this check
+        """
+        # Check if automountServiceAccountToken is explicitly set to
+        # false; if not, it defaults to true
+        automount = ctx[2].automount_service_account_token
+        if automount is None or automount is True:
+            return (self._create_automount_finding(ctx[0], ctx[1]),)
+        return ()
+    
+    def _create_automount_finding(
+        self,
+        pod_name: str,
+        namespace: str
+    ) -> Dict[str, Any]:
+        """Create finding for automounted token"""
+        
+        return self.create_finding(
+            severity="MEDIUM",
+            pod_name=pod_name,
+            namespace=namespace,
+            container_name="<all>",
+            issue="Service account token automounted",
+            description=(_AUTOMOUNT_DESCRIPTION, (pod_name,)),
+            remediation=_AUTOMOUNT_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "rbac"
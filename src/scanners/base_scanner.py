@@ -3,18 +3,122 @@ Base Scanner Class
 All security scanners inherit from this
 """
 
+import os
+import sys
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
 from typing import List, Dict, Any
 
 
+# Severity order for threshold filtering (lower rank = more severe)
+_SEV_RANK = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+# System namespaces whose pods legitimately need host access and
+# missing limits; scanning them mostly produces noise
+SKIP_NAMESPACES = frozenset({'kube-system', 'kube-public', 'kube-node-lease'})
+
+# Pods annotated with this opt out of scanning entirely
+SKIP_ANNOTATION = 'k8s-sec/skip'
+
+
+def should_skip(metadata) -> bool:
+    """
+    Decide whether a pod is exempt from scanning
+
+    Args:
+        metadata: Pod metadata object
+
+    Returns:
+        True when the pod's namespace or annotations opt it out
+    """
+    if metadata.namespace in SKIP_NAMESPACES:
+        return True
+    annotations = metadata.annotations
+    return bool(annotations) and annotations.get(SKIP_ANNOTATION) == 'true'
+
+
+@dataclass(slots=True)
+class Finding:
+    """
+    One security finding
+
+    A slotted record instead of a dict: roughly a quarter of the
+    per-finding memory, faster field access, and a fixed schema.
+    The subscript/get methods keep the dict-style access used by
+    reporters and scorers working unchanged.
+
+    description and remediation may hold either a ready string or a
+    lazy (template, args) pair; summary-style consumers that only
+    aggregate severity/issue never pay for rendering the prose -
+    render_text materializes it when a report displays the field.
+    """
+    scanner: str
+    severity: str
+    pod_name: str
+    namespace: str
+    container_name: str
+    issue: str
+    description: Any
+    remediation: Any
+    compliance: tuple
+    category: str
+    # Integer severity rank (_SEV_RANK), set at creation so sorting
+    # and severity comparisons run on small ints
+    _rank: int = 0
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def render_text(value) -> str:
+    """
+    Materialize a finding text field
+
+    Scanners may store description/remediation as a lazy
+    (template, args) pair instead of a formatted string; rendering
+    is deferred to whichever reporter actually displays the field.
+
+    Args:
+        value: Either a plain string or a (template, args) tuple
+
+    Returns:
+        The formatted string
+    """
+    if isinstance(value, tuple):
+        template, args = value
+        return template.format(*args)
+    return value
+
+
 class BaseScanner(ABC):
     """
     Abstract base class for all security scanners
     """
-    
-    def __init__(self):
+
+    # Finding category, overridden per scanner - a class attribute
+    # rather than a getter so the per-finding hot path reads a constant
+    # instead of making a method call
+    CATEGORY = "security"
+
+
+    def __init__(self, min_severity: str = 'LOW'):
+        """
+        Args:
+            min_severity: Lowest severity worth reporting; findings
+                below it are dropped before their dict is even built
+        """
         self.name = self.__class__.__name__
         self.findings = []
+        self._min_rank = _SEV_RANK[min_severity]
     
     @abstractmethod
     def scan(self, pod) -> List[Dict[str, Any]]:
@@ -29,6 +133,55 @@ class BaseScanner(ABC):
         """
         pass
     
+    def check_pod(self, ctx) -> List[Dict[str, Any]]:
+        """
+        Pod-level checks for the fused scan_all pass
+
+        ctx is the (pod_name, namespace, spec) triple extracted once
+        per pod. Scanners with pod-scoped checks override this; the
+        default reports nothing.
+
+        Args:
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings from pod-level checks
+        """
+        return ()
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Container-level checks for the fused scan_all pass
+
+        Overriding scanners are called once per container from a
+        single shared traversal of spec.containers.
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        return ()
+
+    def scan_many(self, pods) -> List[Dict[str, Any]]:
+        """
+        Scan a batch of pods on a thread pool
+
+        Each pod is independent, so scans dispatch across worker
+        threads; executor.map keeps results in pod order and the
+        per-pod finding lists are flattened into one list.
+
+        Args:
+            pods: Iterable of Kubernetes pod objects
+
+        Returns:
+            List of findings from all pods
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(chain.from_iterable(executor.map(self.scan, pods)))
+
     def create_finding(
         self,
         severity: str,
@@ -38,44 +191,57 @@ class BaseScanner(ABC):
         issue: str,
         description: str,
         remediation: str,
-        compliance: List[str] = None
-    ) -> Dict[str, Any]:
+        compliance: tuple = None,
+        category: str = None
+    ) -> Finding:
         """
-        Create a standardized finding dictionary
-        
+        Create a standardized Finding record
+
         Args:
             severity: CRITICAL, HIGH, MEDIUM, or LOW
             pod_name: Name of the pod
             namespace: Namespace of the pod
             container_name: Name of the container
             issue: Short issue title
-            description: Detailed description
-            remediation: How to fix it
-            compliance: Compliance frameworks (CIS, PCI-DSS, etc.)
-            
+            description: Detailed description, or a lazy
+                (template, args) pair rendered via render_text
+            remediation: How to fix it, same lazy form accepted
+            compliance: Compliance frameworks (CIS, PCI-DSS, etc.),
+                normally a scanner's shared class-level tuple
+            category: Finding category; defaults to the scanner's
+                CATEGORY attribute, scanners spanning several
+                categories pass it per finding
+
         Returns:
-            Dictionary with finding details
-        """
-        return {
-            'scanner': self.name,
-            'severity': severity,
-            'pod_name': pod_name,
-            'namespace': namespace,
-            'container_name': container_name,
-            'issue': issue,
-            'description': description,
-            'remediation': remediation,
-            'compliance': compliance or [],
-            'category': self._get_category()
-        }
-    
-    def _get_category(self) -> str:
-        """
-        Get the category of this scanner
-        Override in subclasses if needed
+            Finding record, or None when the severity falls below
+            this scanner's min_severity threshold
         """
-        return "security"
-    
+        # Below-threshold findings are discarded before any field work
+        # happens - with --min-severity style filtering active this
+        # skips building the record and its description text entirely
+        rank = _SEV_RANK[severity]
+        if rank > self._min_rank:
+            return None
+        # Intern the small-vocabulary fields - severities, issue titles,
+        # names and categories repeat across thousands of findings, so
+        # sharing one string object per distinct value cuts memory and
+        # makes downstream comparisons pointer-fast. The long free-text
+        # description/remediation fields are left alone.
+        # Positional construction - no keyword binding on the hot path
+        return Finding(
+            self.name,
+            sys.intern(severity),
+            sys.intern(pod_name),
+            sys.intern(namespace),
+            sys.intern(container_name),
+            sys.intern(issue),
+            description,
+            remediation,
+            compliance or (),
+            sys.intern(category or self.CATEGORY),
+            rank
+        )
+
     def get_findings(self) -> List[Dict[str, Any]]:
         """
         Get all findings from this scanner
@@ -87,3 +253,97 @@ class BaseScanner(ABC):
         Clear all findings
         """
         self.findings = []
+
+
+def scan_all(pod, scanners):
+    """
+    Run a set of scanners over one pod in a single traversal
+
+    Extracts the pod's metadata/spec attribute chains once and walks
+    spec.containers a single time, dispatching to each scanner's
+    check_pod / check_container hooks. With N scanners and M
+    containers this replaces N separate walks of the pod model with
+    one. Scanners that do not override the hooks fall back to their
+    scan() method unchanged.
+
+    Findings are yielded as they are produced, so consumers that
+    stream (write to a report, forward to a SIEM) never hold more
+    than one finding at a time; list callers just wrap in list().
+
+    Args:
+        pod: Kubernetes pod object
+        scanners: Iterable of BaseScanner instances
+
+    Yields:
+        Findings from all scanners
+    """
+    metadata = pod.metadata
+    spec = pod.spec
+    ctx = (metadata.name, metadata.namespace, spec)
+
+    container_checks = []
+
+    for scanner in scanners:
+        cls = type(scanner)
+        fused = False
+        if cls.check_pod is not BaseScanner.check_pod:
+            yield from scanner.check_pod(ctx)
+            fused = True
+        if cls.check_container is not BaseScanner.check_container:
+            container_checks.append(scanner.check_container)
+            fused = True
+        if not fused:
+            yield from scanner.scan(pod)
+
+    if container_checks:
+        for container in spec.containers:
+            for check in container_checks:
+                yield from check(container, ctx)
+
+
+class ScanCache:
+    """
+    Memoizes scan results for unchanged pods
+
+    Periodic re-scans see mostly identical pods; a pod's
+    resourceVersion only changes when the pod itself does, so results
+    can be served from cache until then. Entries are keyed by pod uid
+    with the resourceVersion stored alongside, so a mutated pod
+    overwrites its stale entry instead of leaving it to age out, and
+    delete events can invalidate by uid. Least recently used entries
+    are evicted past max_entries.
+
+    One cache instance is shared across the scan worker threads, and
+    both the LRU bump in get and the eviction in put are
+    check-then-act sequences, so all access goes through a lock.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self._entries = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, uid, resource_version):
+        """Return the cached findings for the pod, or None on a miss"""
+        with self._lock:
+            entries = self._entries
+            entry = entries.get(uid)
+            if entry is None or entry[0] != resource_version:
+                return None
+            # Re-insert to mark as most recently used
+            del entries[uid]
+            entries[uid] = entry
+            return entry[1]
+
+    def put(self, uid, resource_version, findings):
+        """Cache findings, evicting the oldest entry when full"""
+        with self._lock:
+            entries = self._entries
+            if uid not in entries and len(entries) >= self._max_entries:
+                del entries[next(iter(entries))]
+            entries[uid] = (resource_version, findings)
+
+    def invalidate(self, uid):
+        """Drop the cached findings for a deleted pod"""
+        with self._lock:
+            self._entries.pop(uid, None)
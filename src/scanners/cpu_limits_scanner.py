@@ -4,82 +4,16 @@ Detects containers without CPU limits
 """
 
 from typing import List, Dict, Any
-from .base_scanner import BaseScanner
+from .base_scanner import BaseScanner, Finding
 
 
-class CPULimitsScanner(BaseScanner):
-    """
-    Scans for containers without CPU limits
-    
-    Missing CPU limits allows:
-    - One container to consume all CPU
-    - Noisy neighbor problems
-    - Cluster-wide performance degradation
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if containers have CPU limits
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for containers without CPU limits
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check if resources are defined
-            if container.resources:
-                # Check if limits are defined
-                if container.resources.limits:
-                    cpu_limit = container.resources.limits.get('cpu')
-                    
-                    if cpu_limit is None:
-                        findings.append(self._create_cpu_finding(
-                            pod_name, namespace, container_name,
-                            "CPU limit not defined"
-                        ))
-                else:
-                    # No limits section at all
-                    findings.append(self._create_cpu_finding(
-                        pod_name, namespace, container_name,
-                        "No resource limits section"
-                    ))
-            else:
-                # No resources section at all
-                findings.append(self._create_cpu_finding(
-                    pod_name, namespace, container_name,
-                    "No resources defined"
-                ))
-        
-        return findings
-    
-    def _create_cpu_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        container_name: str,
-        reason: str
-    ) -> Dict[str, Any]:
-        """Create finding for missing CPU limit"""
-        
-        return self.create_finding(
-            severity="HIGH",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=container_name,
-            issue="Missing CPU limit",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has no CPU limit defined.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_CPU_DESCRIPTION = """
+Container '{0}' in pod '{1}' has no CPU limit defined.
 
-Reason: {reason}
+Reason: {2}
 
 Without CPU limits:
 - Container can consume 100% of node CPU
@@ -92,8 +26,9 @@ CPU limits ensure fair resource distribution and prevent
 one container from impacting others.
 
 Best practice: Always set both CPU requests AND limits.
-""".strip(),
-            remediation="""
+""".strip()
+
+_CPU_REMEDIATION = """
 Add CPU limits to your container:
 
 resources:
@@ -113,13 +48,96 @@ Common values:
 
 Set limits based on actual usage (check metrics first).
 Limits should be higher than requests to allow bursting.
-""".strip(),
-            compliance=[
-                "CIS-5.2.7",
-                "PCI-DSS-2.2",
-                "Resource Management Best Practices"
-            ]
+""".strip()
+
+
+class CPULimitsScanner(BaseScanner):
+    """
+    Scans for containers without CPU limits
+    
+    Missing CPU limits allows:
+    - One container to consume all CPU
+    - Noisy neighbor problems
+    - Cluster-wide performance degradation
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "resource_management"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.7",
+        "PCI-DSS-2.2",
+        "Resource Management Best Practices"
+    )
+    
+    def scan(self, pod) -> List[Finding]:
+        """
+        Check if containers have CPU limits
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for containers without CPU limits
+        """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
+        findings = []
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
+        return findings
+
+    def check_container(self, container, ctx) -> List[Finding]:
+        """
+        Check one container for a missing CPU limit
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        resources = container.resources
+        # Check if resources are defined
+        if resources:
+            # Check if limits are defined
+            if resources.limits:
+                if resources.limits.get('cpu') is not None:
+                    return ()
+                reason = "CPU limit not defined"
+            else:
+                # No limits section at all
+                reason = "No resource limits section"
+        else:
+            # No resources section at all
+            reason = "No resources defined"
+
+        return (self._create_cpu_finding(
+            ctx[0], ctx[1], container.name, reason
+        ),)
+    
+    def _create_cpu_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: str,
+        reason: str
+    ) -> Finding:
+        """Create finding for missing CPU limit"""
+        
+        return self.create_finding(
+            "HIGH",
+            pod_name,
+            namespace,
+            container_name,
+            "Missing CPU limit",
+            (_CPU_DESCRIPTION, (container_name, pod_name, reason)),
+            _CPU_REMEDIATION,
+            self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "resource_management"
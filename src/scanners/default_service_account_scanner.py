@@ -4,61 +4,16 @@ Detects pods using default service account
 """
 
 from typing import List, Dict, Any
-from .base_scanner import BaseScanner
+from .base_scanner import BaseScanner, Finding
 
 
-class DefaultServiceAccountScanner(BaseScanner):
-    """
-    Scans for pods using default service account
-    
-    Default service accounts have unnecessary permissions
-    and should not be used.
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if pods use default service account
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for default service account usage
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        # Check service account name
-        service_account = pod.spec.service_account_name or pod.spec.service_account
-        
-        # If not specified, it defaults to "default"
-        if not service_account or service_account == "default":
-            findings.append(self._create_sa_finding(
-                pod_name, namespace, service_account or "default"
-            ))
-        
-        return findings
-    
-    def _create_sa_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        service_account: str
-    ) -> Dict[str, Any]:
-        """Create finding for default service account usage"""
-        
-        return self.create_finding(
-            severity="MEDIUM",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name="<all>",
-            issue="Using default service account",
-            description=f"""
-Pod '{pod_name}' is using the default service account.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_SA_DESCRIPTION = """
+Pod '{0}' is using the default service account.
 
-Service account: {service_account}
+Service account: {1}
 
 Problems with default service account:
 - Has unnecessary API permissions
@@ -76,8 +31,9 @@ With default service account, this token can:
 - Make API calls you didn't intend
 
 Best practice: Create dedicated service accounts for each application.
-""".strip(),
-            remediation="""
+""".strip()
+
+_SA_REMEDIATION = """
 Create and use a dedicated service account:
 
 Step 1: Create ServiceAccount
@@ -126,12 +82,80 @@ spec:
   containers:
   - name: myapp
     ...
-""".strip(),
-            compliance=[
-                "CIS-5.1.5",
-                "RBAC Best Practices"
-            ]
+""".strip()
+
+
+class DefaultServiceAccountScanner(BaseScanner):
+    """
+    Scans for pods using default service account
+    
+    Default service accounts have unnecessary permissions
+    and should not be used.
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "rbac"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.1.5",
+        "RBAC Best Practices"
+    )
+    
+    def scan(self, pod) -> List[Finding]:
+        """
+        Check if pods use default service account
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for default service account usage
+        """
+        metadata = pod.metadata
+        return list(self.check_pod(
+            (metadata.name, metadata.namespace, pod.spec)
+        ))
+
+    def check_pod(self, ctx) -> List[Finding]:
+        """
+        Check the pod's service account
+
+        Args:
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for default service account usage
+        """
+        pod_name, namespace, spec = ctx
+
+        # Check service account name
+        service_account = spec.service_account_name or spec.service_account
+
+        # If not specified, it defaults to "default"
+        if not service_account or service_account == "default":
+            return (self._create_sa_finding(
+                pod_name, namespace, service_account or "default"
+            ),)
+
+        return ()
+    
+    def _create_sa_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        service_account: str
+    ) -> Finding:
+        """Create finding for default service account usage"""
+        
+        return self.create_finding(
+            "MEDIUM",
+            pod_name,
+            namespace,
+            "<all>",
+            "Using default service account",
+            (_SA_DESCRIPTION, (pod_name, service_account)),
+            _SA_REMEDIATION,
+            self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "rbac"
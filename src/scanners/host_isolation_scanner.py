@@ -0,0 +1,326 @@
+"""
+Host Isolation Scanner
+Detects pods sharing the host network, PID or IPC namespaces
+"""
+
+from typing import List, Dict, Any
+from .base_scanner import BaseScanner, Finding
+
+
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_HOST_NETWORK_DESCRIPTION = """
+Pod '{0}' is using the host network (hostNetwork: true).
+
+This is a HIGH security risk because:
+- Pod shares the node's network namespace
+- Can see ALL network traffic on the node
+- Can intercept traffic from other pods
+- Can bind to any port on the node (including privileged ports)
+- Breaks Kubernetes network isolation model
+- Can perform man-in-the-middle attacks
+- Bypasses Network Policies
+
+Host network should ONLY be used for:
+- CNI plugins (networking infrastructure)
+- Node-level monitoring tools
+- System daemons that require host network access
+
+For normal applications, this is almost never needed.
+""".strip()
+
+_HOST_NETWORK_REMEDIATION = """
+Remove hostNetwork from your pod spec:
+
+# BEFORE (Bad):
+spec:
+  hostNetwork: true    # ❌ REMOVE THIS
+  containers:
+  - name: myapp
+    ...
+
+# AFTER (Good):
+spec:
+  # hostNetwork removed - uses pod network
+  containers:
+  - name: myapp
+    ports:
+    - containerPort: 8080  # Use pod network
+
+If you need specific networking features:
+1. Use Services for external access
+2. Use NetworkPolicies for isolation
+3. Use Ingress for HTTP routing
+4. Use specific capabilities if needed
+
+Valid use cases for hostNetwork:
+- kube-proxy (needs to configure node networking)
+- CNI plugins (calico, flannel, weave)
+- Node metrics exporters
+- DaemonSets that manage node networking
+
+For 99% of applications: DO NOT use hostNetwork!
+""".strip()
+
+_HOST_PID_DESCRIPTION = """
+Pod '{0}' is using the host PID namespace (hostPID: true).
+
+This is a security risk because:
+- Pod can see ALL processes on the node (ps aux shows host processes)
+- Can signal or kill host processes
+- Can read /proc files from other processes
+- Breaks process isolation
+- Can inspect other containers' processes
+- Access to sensitive process information
+
+With hostPID, a container can:
+1. See kubelet processes
+2. Kill node-critical processes
+3. Read environment variables of other processes
+4. Perform privilege escalation attacks
+
+hostPID should ONLY be used for:
+- System monitoring tools (node exporter, cAdvisor)
+- Debugging DaemonSets
+- Process management tools
+
+For regular applications, this is unnecessary.
+""".strip()
+
+_HOST_PID_REMEDIATION = """
+Remove hostPID from your pod spec:
+
+# BEFORE (Bad):
+spec:
+  hostPID: true    # ❌ REMOVE THIS
+  containers:
+  - name: myapp
+    ...
+
+# AFTER (Good):
+spec:
+  # hostPID removed - uses pod PID namespace
+  containers:
+  - name: myapp
+    ...
+
+If you need to interact with processes:
+1. Use proper APIs instead of direct process access
+2. Use sidecar containers for monitoring
+3. Use Kubernetes metrics APIs
+4. Use pod-level resource metrics
+
+Valid use cases for hostPID:
+- node-exporter (Prometheus metrics)
+- Process monitoring DaemonSets
+- Debugging tools (temporary)
+
+For normal apps: Never use hostPID!
+""".strip()
+
+_HOST_IPC_DESCRIPTION = """
+Pod '{0}' is using the host IPC namespace (hostIPC: true).
+
+This is a security risk because:
+- Pod can access host's shared memory
+- Can read/write IPC resources (semaphores, message queues)
+- Can communicate with host processes via shared memory
+- Breaks IPC isolation
+- Can leak sensitive data through shared memory
+
+Inter-Process Communication (IPC) includes:
+- Shared memory segments
+- Semaphores
+- Message queues
+- Shared memory from other pods/processes
+
+With hostIPC, containers can:
+1. Read shared memory from other applications
+2. Inject data into other processes
+3. Steal sensitive information
+4. Cause denial of service
+
+hostIPC should ONLY be used for:
+- Applications specifically requiring host IPC
+- Legacy applications with IPC dependencies
+- System-level monitoring
+
+This is rarely needed for modern applications.
+""".strip()
+
+_HOST_IPC_REMEDIATION = """
+Remove hostIPC from your pod spec:
+
+# BEFORE (Bad):
+spec:
+  hostIPC: true    # ❌ REMOVE THIS
+  containers:
+  - name: myapp
+    ...
+
+# AFTER (Good):
+spec:
+  # hostIPC removed - uses pod IPC namespace
+  containers:
+  - name: myapp
+    ...
+
+If you need inter-process communication:
+1. Use network sockets (TCP/UDP)
+2. Use shared volumes (emptyDir)
+3. Use message queues (RabbitMQ, Kafka)
+4. Use gRPC or REST APIs
+5. Use Kubernetes Services
+
+Modern IPC alternatives:
+- Network-based: gRPC, HTTP, WebSockets
+- File-based: Shared volumes, Unix sockets
+- Queue-based: Message brokers
+
+Valid use cases for hostIPC:
+- Legacy apps requiring System V IPC
+- Specific monitoring tools
+- Database with shared memory requirements
+
+For 99% of apps: Use network-based communication!
+""".strip()
+
+
+class HostIsolationScanner(BaseScanner):
+    """
+    Scans for pods sharing host namespaces
+
+    Merges the former HostNetworkScanner and HostNamespacesScanner:
+    all three host_* flags live on the same pod spec, so one pass with
+    three if checks replaces two scanners' separate spec traversals
+    and duplicated boilerplate.
+
+    hostNetwork / hostPID / hostIPC are dangerous because:
+    - Pod can see node traffic and all node processes
+    - Can intercept traffic from other pods
+    - Can signal/kill node processes
+    - Can access host shared memory
+    - Breaks the pod isolation model
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "host_access"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _NETWORK_COMPLIANCE = (
+        "CIS-5.2.4",
+        "PCI-DSS-1.2.1",
+        "Network Isolation Best Practices"
+    )
+    _PID_COMPLIANCE = (
+        "CIS-5.2.2",
+        "Process Isolation",
+        "Container Security Best Practices"
+    )
+    _IPC_COMPLIANCE = (
+        "CIS-5.2.3",
+        "IPC Isolation",
+        "Container Security Best Practices"
+    )
+
+    def scan(self, pod) -> List[Finding]:
+        """
+        Check if pods share host namespaces
+
+        Args:
+            pod: Kubernetes pod object
+
+        Returns:
+            List of findings for host namespace sharing
+        """
+        metadata = pod.metadata
+        return list(self.check_pod(
+            (metadata.name, metadata.namespace, pod.spec)
+        ))
+
+    def check_pod(self, ctx) -> List[Finding]:
+        """
+        Check all host_* flags on the pod spec in one pass
+
+        Args:
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for host network/PID/IPC usage
+        """
+        pod_name, namespace, spec = ctx
+        findings = []
+
+        if spec.host_network:
+            findings.append(self._create_host_network_finding(
+                pod_name, namespace
+            ))
+
+        if spec.host_pid:
+            findings.append(self._create_host_pid_finding(
+                pod_name, namespace
+            ))
+
+        if spec.host_ipc:
+            findings.append(self._create_host_ipc_finding(
+                pod_name, namespace
+            ))
+
+        return findings
+
+    def _create_host_network_finding(
+        self,
+        pod_name: str,
+        namespace: str
+    ) -> Finding:
+        """Create finding for host network usage"""
+
+        return self.create_finding(
+            "HIGH",
+            pod_name,
+            namespace,
+            "<all>",
+            "Pod using host network",
+            (_HOST_NETWORK_DESCRIPTION, (pod_name,)),
+            _HOST_NETWORK_REMEDIATION,
+            self._NETWORK_COMPLIANCE,
+            category="network_security"
+        )
+
+    def _create_host_pid_finding(
+        self,
+        pod_name: str,
+        namespace: str
+    ) -> Finding:
+        """Create finding for hostPID usage"""
+
+        return self.create_finding(
+            "MEDIUM",
+            pod_name,
+            namespace,
+            "<all>",
+            "Pod using host PID namespace",
+            (_HOST_PID_DESCRIPTION, (pod_name,)),
+            _HOST_PID_REMEDIATION,
+            self._PID_COMPLIANCE
+        )
+
+    def _create_host_ipc_finding(
+        self,
+        pod_name: str,
+        namespace: str
+    ) -> Finding:
+        """Create finding for hostIPC usage"""
+
+        return self.create_finding(
+            "MEDIUM",
+            pod_name,
+            namespace,
+            "<all>",
+            "Pod using host IPC namespace",
+            (_HOST_IPC_DESCRIPTION, (pod_name,)),
+            _HOST_IPC_REMEDIATION,
+            self._IPC_COMPLIANCE
+        )
+
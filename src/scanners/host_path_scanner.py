@@ -3,79 +3,24 @@ Host Path Volumes Scanner
 Detects containers mounting host filesystem
 """
 
+from operator import attrgetter
 from typing import List, Dict, Any
-from .base_scanner import BaseScanner
+from .base_scanner import BaseScanner, Finding
 
+# C-level accessors for the mount-index inner loop
+_name = attrgetter('name')
+_volume_mounts = attrgetter('volume_mounts')
 
-class HostPathScanner(BaseScanner):
-    """
-    Scans for host path volume mounts
-    
-    hostPath volumes are dangerous because:
-    - Direct access to host filesystem
-    - Can read/modify node files
-    - Container escape vector
-    - Data persistence issues
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if pods use hostPath volumes
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for hostPath usage
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        if pod.spec.volumes:
-            for volume in pod.spec.volumes:
-                if volume.host_path:
-                    # Find which containers use this volume
-                    containers_using = []
-                    for container in pod.spec.containers:
-                        if container.volume_mounts:
-                            for mount in container.volume_mounts:
-                                if mount.name == volume.name:
-                                    containers_using.append(container.name)
-                    
-                    findings.append(self._create_hostpath_finding(
-                        pod_name, namespace, volume.name,
-                        volume.host_path.path,
-                        containers_using
-                    ))
-        
-        return findings
-    
-    def _create_hostpath_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        volume_name: str,
-        host_path: str,
-        containers: List[str]
-    ) -> Dict[str, Any]:
-        """Create finding for hostPath volume"""
-        
-        containers_str = ", ".join(containers) if containers else "none"
-        
-        return self.create_finding(
-            severity="HIGH",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=containers_str,
-            issue=f"Using hostPath volume: {host_path}",
-            description=f"""
-Pod '{pod_name}' mounts host filesystem using hostPath volume.
-
-Volume name: {volume_name}
-Host path: {host_path}
-Used by containers: {containers_str}
+
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_HOSTPATH_DESCRIPTION = """
+Pod '{0}' mounts host filesystem using hostPath volume.
+
+Volume name: {1}
+Host path: {2}
+Used by containers: {3}
 
 hostPath volumes are HIGH security risks:
 - Direct access to node's filesystem
@@ -97,30 +42,31 @@ hostPath should ONLY be used for:
 - DaemonSets that manage nodes
 - Log collection agents
 - Monitoring agents that need node metrics
-""".strip(),
-            remediation=f"""
+""".strip()
+
+_HOSTPATH_REMEDIATION = """
 Replace hostPath with safer alternatives:
 
 # BEFORE (Bad):
 volumes:
-- name: {volume_name}
+- name: {0}
   hostPath:
-    path: {host_path}      # ❌ Direct host access
+    path: {1}      # ❌ Direct host access
 
 # AFTER - Option 1: Use emptyDir (temporary storage)
 volumes:
-- name: {volume_name}
+- name: {0}
   emptyDir: {{}}            # ✅ Temporary pod storage
 
 # AFTER - Option 2: Use PersistentVolumeClaim
 volumes:
-- name: {volume_name}
+- name: {0}
   persistentVolumeClaim:   # ✅ Managed storage
     claimName: my-pvc
 
 # AFTER - Option 3: Use ConfigMap/Secret
 volumes:
-- name: {volume_name}
+- name: {0}
   configMap:               # ✅ Configuration data
     name: my-config
 
@@ -144,13 +90,105 @@ If you MUST use hostPath:
 - Use specific subdirectories, not /
 - Document why it's necessary
 - Use Pod Security Policies to restrict
-""".strip(),
-            compliance=[
-                "CIS-5.2.3",
-                "Container Isolation",
-                "Data Security Best Practices"
-            ]
+""".strip()
+
+
+class HostPathScanner(BaseScanner):
+    """
+    Scans for host path volume mounts
+    
+    hostPath volumes are dangerous because:
+    - Direct access to host filesystem
+    - Can read/modify node files
+    - Container escape vector
+    - Data persistence issues
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "host_access"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.3",
+        "Container Isolation",
+        "Data Security Best Practices"
+    )
+    
+    def scan(self, pod) -> List[Finding]:
+        """
+        Check if pods use hostPath volumes
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for hostPath usage
+        """
+        metadata = pod.metadata
+        return list(self.check_pod(
+            (metadata.name, metadata.namespace, pod.spec)
+        ))
+
+    def check_pod(self, ctx) -> List[Finding]:
+        """
+        Check the pod's volumes for hostPath mounts
+
+        Args:
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for hostPath usage
+        """
+        pod_name, namespace, spec = ctx
+        findings = []
+
+        # Bind the spec collections once - every .volumes/.containers
+        # access goes through the client model's attribute map
+        volumes = spec.volumes
+        if volumes:
+            # Build a volume-name -> container-names index in one pass
+            # over the mounts instead of rescanning every container for
+            # every hostPath volume (O(C*M + V) instead of O(V*C*M))
+            mount_index = {}
+            for container in spec.containers:
+                mounts = _volume_mounts(container)
+                if mounts:
+                    container_name = _name(container)
+                    for mount in mounts:
+                        mount_index.setdefault(_name(mount), []).append(
+                            container_name
+                        )
+
+            for volume in volumes:
+                if volume.host_path:
+                    findings.append(self._create_hostpath_finding(
+                        pod_name, namespace, volume.name,
+                        volume.host_path.path,
+                        mount_index.get(volume.name, [])
+                    ))
+
+        return findings
+    
+    def _create_hostpath_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        volume_name: str,
+        host_path: str,
+        containers: List[str]
+    ) -> Finding:
+        """Create finding for hostPath volume"""
+        
+        containers_str = ", ".join(containers) if containers else "none"
+        
+        return self.create_finding(
+            "HIGH",
+            pod_name,
+            namespace,
+            containers_str,
+            f"Using hostPath volume: {host_path}",
+            (_HOSTPATH_DESCRIPTION, (pod_name, volume_name, host_path, containers_str)),
+            (_HOSTPATH_REMEDIATION, (volume_name, host_path)),
+            self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "host_access"
@@ -0,0 +1,61 @@
+"""
+Image Reference Parsing
+Shared single-pass parser for container image strings
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class ImageRef(NamedTuple):
+    """
+    Parsed components of an image reference
+
+    tag and digest are empty strings when absent; an image with
+    neither implicitly resolves to :latest at pull time.
+    """
+    registry: str
+    repo: str
+    tag: str
+    digest: str
+
+
+# Memoized - the registry, tag and untagged scanners all consume the
+# same parse, and replicated workloads repeat the same image string,
+# so each distinct image is dissected exactly once per process
+@lru_cache(maxsize=4096)
+def parse_image(image: str) -> ImageRef:
+    """
+    Split an image reference into (registry, repo, tag, digest)
+
+    Handles the forms the scanners care about:
+        image, image:tag, image@sha256:..., registry/repo/image:tag,
+        registry:port/image:tag
+
+    Args:
+        image: Raw image string from the container spec
+
+    Returns:
+        ImageRef with empty strings for missing components
+    """
+    # Registry: text before the first '/', when it looks like a host
+    # ('.' or ':' present); otherwise Docker Hub is implied
+    slash = image.find('/')
+    if slash != -1 and ('.' in image[:slash] or ':' in image[:slash]):
+        registry = image[:slash]
+        rest = image[slash + 1:]
+    else:
+        registry = 'docker.io'
+        rest = image
+
+    # Digest pins (repo@sha256:...) take precedence over tags
+    at = rest.find('@')
+    if at != -1:
+        return ImageRef(registry, rest[:at], '', rest[at + 1:])
+
+    # Tag: text after the last ':' of the last path segment, so a
+    # registry port never reads as a tag
+    colon = rest.rfind(':')
+    if colon > rest.rfind('/'):
+        return ImageRef(registry, rest[:colon], rest[colon + 1:], '')
+    return ImageRef(registry, rest, '', '')
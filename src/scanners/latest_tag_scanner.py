@@ -5,6 +5,62 @@ Detects containers using :latest image tag
 
 from typing import List, Dict, Any
 from .base_scanner import BaseScanner
+from .image_ref import parse_image
+
+
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_LATEST_DESCRIPTION = """
+Container '{0}' in pod '{1}' uses :latest tag.
+
+Image: {2}
+
+The :latest tag is unpredictable because:
+- It changes every time a new image is pushed
+- You don't know which version is actually running
+- Different nodes may pull different versions
+- Breaks deployment reproducibility
+- Makes rollbacks impossible
+- Causes "works on my machine" issues
+
+In production, :latest can pull a broken image without warning.
+
+Best practice: ALWAYS use specific version tags.
+""".strip()
+
+_LATEST_REMEDIATION = """
+Replace :latest with a specific version tag:
+
+# BEFORE (Bad):
+image: {0}
+
+# AFTER (Good):
+image: {1}:1.21.6
+# OR
+image: {1}:v2.3.1
+# OR
+image: {1}:sha256-abc123...  # Most secure - immutable
+
+Version tag strategies:
+1. Semantic versioning: nginx:1.21.6
+2. Git commit SHA: myapp:a1b2c3d
+3. Build number: myapp:build-1234
+4. Image digest: nginx@sha256:abc123... (immutable)
+
+Recommended: Use semantic versioning for readability, 
+or image digests for maximum security.
+""".strip()
+
+
+def _is_latest(image: str) -> bool:
+    """
+    Check whether an image reference pins the :latest tag
+
+    Untagged images (which implicitly resolve to :latest) are
+    reported by UntaggedImageScanner instead.
+    """
+    return parse_image(image).tag == 'latest'
 
 
 class LatestTagScanner(BaseScanner):
@@ -16,6 +72,16 @@ class LatestTagScanner(BaseScanner):
     - Can change without warning
     - Breaks reproducibility
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "image_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.4.1",
+        "Image Security Best Practices",
+        "Deployment Reproducibility"
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -27,22 +93,33 @@ class LatestTagScanner(BaseScanner):
         Returns:
             List of findings for containers using :latest
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            image = container.image
-            
-            # Check if image ends with :latest or has :latest explicitly
-            if image.endswith(':latest') or ':latest' in image:
-                findings.append(self._create_latest_finding(
-                    pod_name, namespace, container_name, image
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for the :latest image tag
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        image = container.image
+        if _is_latest(image):
+            return (self._create_latest_finding(
+                ctx[0], ctx[1], container.name, image
+            ),)
+        return ()
     
     def _create_latest_finding(
         self,
@@ -62,51 +139,8 @@ class LatestTagScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Using :latest image tag",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' uses :latest tag.
-
-Image: {image}
-
-The :latest tag is unpredictable because:
-- It changes every time a new image is pushed
-- You don't know which version is actually running
-- Different nodes may pull different versions
-- Breaks deployment reproducibility
-- Makes rollbacks impossible
-- Causes "works on my machine" issues
-
-In production, :latest can pull a broken image without warning.
-
-Best practice: ALWAYS use specific version tags.
-""".strip(),
-            remediation=f"""
-Replace :latest with a specific version tag:
-
-# BEFORE (Bad):
-image: {image}
-
-# AFTER (Good):
-image: {image_base}:1.21.6
-# OR
-image: {image_base}:v2.3.1
-# OR
-image: {image_base}:sha256-abc123...  # Most secure - immutable
-
-Version tag strategies:
-1. Semantic versioning: nginx:1.21.6
-2. Git commit SHA: myapp:a1b2c3d
-3. Build number: myapp:build-1234
-4. Image digest: nginx@sha256:abc123... (immutable)
-
-Recommended: Use semantic versioning for readability, 
-or image digests for maximum security.
-""".strip(),
-            compliance=[
-                "CIS-5.4.1",
-                "Image Security Best Practices",
-                "Deployment Reproducibility"
-            ]
+            description=(_LATEST_DESCRIPTION, (container_name, pod_name, image)),
+            remediation=(_LATEST_REMEDIATION, (image, image_base)),
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "image_security"
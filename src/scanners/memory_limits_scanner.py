@@ -7,6 +7,60 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_MEMORY_DESCRIPTION = """
+Container '{0}' in pod '{1}' has no memory limit defined.
+
+Reason: {2}
+
+Without memory limits:
+- Container can consume all node memory
+- Triggers Out of Memory (OOM) killer
+- Can crash the entire node
+- Causes cascading pod evictions
+- Makes capacity planning impossible
+
+Memory limits are CRITICAL for cluster stability.
+A single memory leak can bring down an entire node.
+""".strip()
+
+_MEMORY_REMEDIATION = """
+Add memory limits to your container:
+
+resources:
+  limits:
+    memory: "512Mi"     # 512 Mebibytes
+    # OR
+    memory: "1Gi"       # 1 Gibibyte
+    # OR
+    memory: "2Gi"       # 2 Gibibytes
+  requests:
+    memory: "256Mi"     # Guaranteed memory allocation
+
+Common values:
+- Small workloads: 128Mi - 512Mi
+- Medium workloads: 512Mi - 2Gi
+- Large workloads: 2Gi - 8Gi
+
+Important:
+- Use Mi (Mebibytes) or Gi (Gibibytes), not MB/GB
+- Set limits based on actual usage + 20-30% buffer
+- Memory limits are HARD limits (OOM kill if exceeded)
+- Unlike CPU, memory cannot be throttled
+""".strip()
+
+
+# Which level of the resources chain was absent, keyed on
+# (no resources, no limits)
+_MEMORY_REASONS = {
+    (False, False): "Memory limit not defined",
+    (False, True): "No resource limits section",
+    (True, True): "No resources defined",
+}
+
+
 class MemoryLimitsScanner(BaseScanner):
     """
     Scans for containers without memory limits
@@ -16,6 +70,16 @@ class MemoryLimitsScanner(BaseScanner):
     - Node crashes
     - Cascading failures
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "resource_management"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.8",
+        "PCI-DSS-2.2",
+        "Resource Management Best Practices"
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -27,35 +91,38 @@ class MemoryLimitsScanner(BaseScanner):
         Returns:
             List of findings for containers without memory limits
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            if container.resources:
-                if container.resources.limits:
-                    memory_limit = container.resources.limits.get('memory')
-                    
-                    if memory_limit is None:
-                        findings.append(self._create_memory_finding(
-                            pod_name, namespace, container_name,
-                            "Memory limit not defined"
-                        ))
-                else:
-                    findings.append(self._create_memory_finding(
-                        pod_name, namespace, container_name,
-                        "No resource limits section"
-                    ))
-            else:
-                findings.append(self._create_memory_finding(
-                    pod_name, namespace, container_name,
-                    "No resources defined"
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for a missing memory limit
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        # One walk down the resources chain; which level was missing
+        # picks the reason from the table instead of nested branches
+        resources = container.resources
+        limits = resources.limits if resources else None
+        if limits and limits.get('memory') is not None:
+            return ()
+
+        return (self._create_memory_finding(
+            ctx[0], ctx[1], container.name,
+            _MEMORY_REASONS[(not resources, not limits)]
+        ),)
     
     def _create_memory_finding(
         self,
@@ -72,51 +139,8 @@ class MemoryLimitsScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Missing memory limit",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has no memory limit defined.
-
-Reason: {reason}
-
-Without memory limits:
-- Container can consume all node memory
-- Triggers Out of Memory (OOM) killer
-- Can crash the entire node
-- Causes cascading pod evictions
-- Makes capacity planning impossible
-
-Memory limits are CRITICAL for cluster stability.
-A single memory leak can bring down an entire node.
-""".strip(),
-            remediation="""
-Add memory limits to your container:
-
-resources:
-  limits:
-    memory: "512Mi"     # 512 Mebibytes
-    # OR
-    memory: "1Gi"       # 1 Gibibyte
-    # OR
-    memory: "2Gi"       # 2 Gibibytes
-  requests:
-    memory: "256Mi"     # Guaranteed memory allocation
-
-Common values:
-- Small workloads: 128Mi - 512Mi
-- Medium workloads: 512Mi - 2Gi
-- Large workloads: 2Gi - 8Gi
-
-Important:
-- Use Mi (Mebibytes) or Gi (Gibibytes), not MB/GB
-- Set limits based on actual usage + 20-30% buffer
-- Memory limits are HARD limits (OOM kill if exceeded)
-- Unlike CPU, memory cannot be throttled
-""".strip(),
-            compliance=[
-                "CIS-5.2.8",
-                "PCI-DSS-2.2",
-                "Resource Management Best Practices"
-            ]
+            description=(_MEMORY_DESCRIPTION, (container_name, pod_name, reason)),
+            remediation=_MEMORY_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "resource_management"
@@ -7,55 +7,11 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
-class MissingSecurityContextScanner(BaseScanner):
-    """
-    Scans for containers without security context
-    
-    Security context is essential for defining security constraints.
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if containers have security context
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for missing security context
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check if security context is defined
-            if not container.security_context:
-                findings.append(self._create_missing_sc_finding(
-                    pod_name, namespace, container_name
-                ))
-        
-        return findings
-    
-    def _create_missing_sc_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        container_name: str
-    ) -> Dict[str, Any]:
-        """Create finding for missing security context"""
-        
-        return self.create_finding(
-            severity="MEDIUM",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=container_name,
-            issue="No security context defined",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has no security context.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_MISSING_SC_DESCRIPTION = """
+Container '{0}' in pod '{1}' has no security context.
 
 Without security context, you cannot control:
 - User/group IDs (may run as root)
@@ -68,8 +24,9 @@ Without security context, you cannot control:
 This means the container uses default settings which are often insecure.
 
 Best practice: Always define security context explicitly.
-""".strip(),
-            remediation="""
+""".strip()
+
+_MISSING_SC_REMEDIATION = """
 Add a security context to your container:
 
 containers:
@@ -104,12 +61,80 @@ securityContext:
       - ALL
   seccompProfile:
     type: RuntimeDefault
-""".strip(),
-            compliance=[
-                "CIS-5.2.6",
-                "Pod Security Standards"
-            ]
+""".strip()
+
+
+class MissingSecurityContextScanner(BaseScanner):
+    """
+    Scans for containers without security context
+    
+    Security context is essential for defining security constraints.
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.6",
+        "Pod Security Standards"
+    )
+    
+    def scan(self, pod) -> List[Dict[str, Any]]:
+        """
+        Check if containers have security context
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for missing security context
+        """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
+        findings = []
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
+        return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for a missing security context
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        # Pod-level securityContext inherits to containers that don't
+        # define their own, so only flag when neither level sets one
+        if not (container.security_context or ctx[2].security_context):
+            return (self._create_missing_sc_finding(
+                ctx[0], ctx[1], container.name
+            ),)
+        return ()
+    
+    def _create_missing_sc_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: str
+    ) -> Dict[str, Any]:
+        """Create finding for missing security context"""
+        
+        return self.create_finding(
+            severity="MEDIUM",
+            pod_name=pod_name,
+            namespace=namespace,
+            container_name=container_name,
+            issue="No security context defined",
+            description=(_MISSING_SC_DESCRIPTION, (container_name, pod_name)),
+            remediation=_MISSING_SC_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
@@ -7,6 +7,41 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_ESC_DESCRIPTION = """
+Container '{0}' in pod '{1}' allows privilege escalation.
+
+Reason: {2}
+
+When allowPrivilegeEscalation is true (or not set), processes can:
+- Gain additional privileges via setuid/setgid binaries
+- Use sudo or su to become root
+- Escalate capabilities beyond what was granted initially
+
+This violates the principle of least privilege and can be exploited 
+by attackers to gain higher permissions.
+
+Best practice: Always set allowPrivilegeEscalation: false unless 
+absolutely necessary.
+""".strip()
+
+_ESC_REMEDIATION = """
+Explicitly disable privilege escalation:
+
+securityContext:
+  allowPrivilegeEscalation: false  # ✅ Always set this
+  runAsNonRoot: true
+  capabilities:
+    drop:
+      - ALL
+
+This prevents processes from gaining more privileges than 
+their parent process, even if setuid binaries exist in the container.
+""".strip()
+
+
 class PrivilegeEscalationScanner(BaseScanner):
     """
     Scans for containers that allow privilege escalation
@@ -14,6 +49,16 @@ class PrivilegeEscalationScanner(BaseScanner):
     allowPrivilegeEscalation controls whether a process can gain 
     more privileges than its parent process.
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.5",
+        "PCI-DSS-2.2.4",
+        "NIST-800-190"
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -25,47 +70,51 @@ class PrivilegeEscalationScanner(BaseScanner):
         Returns:
             List of findings for containers allowing privilege escalation
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check security context
-            if container.security_context:
-                allow_priv_esc = container.security_context.allow_privilege_escalation
-                
-                # If explicitly set to true OR not set (defaults to true if privileged)
-                if allow_priv_esc is True:
-                    findings.append(self._create_finding_esc(
-                        pod_name, namespace, container_name,
-                        "Explicitly allows privilege escalation"
-                    ))
-                elif allow_priv_esc is None:
-                    # Check if container is privileged
-                    if container.security_context.privileged:
-                        # Privileged containers implicitly allow escalation
-                        findings.append(self._create_finding_esc(
-                            pod_name, namespace, container_name,
-                            "Privileged container (implicitly allows escalation)"
-                        ))
-                    else:
-                        # Not set and not privileged - could be dangerous
-                        # In older K8s versions, this defaults to true
-                        findings.append(self._create_finding_esc(
-                            pod_name, namespace, container_name,
-                            "allowPrivilegeEscalation not explicitly set to false"
-                        ))
-            else:
-                # No security context - defaults allow escalation
-                findings.append(self._create_finding_esc(
-                    pod_name, namespace, container_name,
-                    "No security context (defaults allow escalation)"
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for allowed privilege escalation
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        sc = container.security_context
+        if sc:
+            allow_priv_esc = sc.allow_privilege_escalation
+
+            # If explicitly set to true OR not set (defaults to true if privileged)
+            if allow_priv_esc is True:
+                reason = "Explicitly allows privilege escalation"
+            elif allow_priv_esc is None:
+                if sc.privileged:
+                    # Privileged containers implicitly allow escalation
+                    reason = "Privileged container (implicitly allows escalation)"
+                else:
+                    # Not set and not privileged - could be dangerous
+                    # In older K8s versions, this defaults to true
+                    reason = "allowPrivilegeEscalation not explicitly set to false"
+            else:
+                return ()
+        else:
+            # No security context - defaults allow escalation
+            reason = "No security context (defaults allow escalation)"
+
+        return (self._create_finding_esc(
+            ctx[0], ctx[1], container.name, reason
+        ),)
     
     def _create_finding_esc(
         self,
@@ -82,41 +131,8 @@ class PrivilegeEscalationScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Privilege escalation allowed",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' allows privilege escalation.
-
-Reason: {reason}
-
-When allowPrivilegeEscalation is true (or not set), processes can:
-- Gain additional privileges via setuid/setgid binaries
-- Use sudo or su to become root
-- Escalate capabilities beyond what was granted initially
-
-This violates the principle of least privilege and can be exploited 
-by attackers to gain higher permissions.
-
-Best practice: Always set allowPrivilegeEscalation: false unless 
-absolutely necessary.
-""".strip(),
-            remediation="""
-Explicitly disable privilege escalation:
-
-securityContext:
-  allowPrivilegeEscalation: false  # ✅ Always set this
-  runAsNonRoot: true
-  capabilities:
-    drop:
-      - ALL
-
-This prevents processes from gaining more privileges than 
-their parent process, even if setuid binaries exist in the container.
-""".strip(),
-            compliance=[
-                "CIS-5.2.5",
-                "PCI-DSS-2.2.4",
-                "NIST-800-190"
-            ]
+            description=(_ESC_DESCRIPTION, (container_name, pod_name, reason)),
+            remediation=_ESC_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
@@ -7,6 +7,53 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_PRIVILEGED_DESCRIPTION = """
+Container '{0}' in pod '{1}' is running with privileged: true.
+
+This is EXTREMELY DANGEROUS because privileged containers:
+- Have ALL Linux capabilities (CAP_SYS_ADMIN, etc.)
+- Can access ALL host devices (/dev/*)
+- Can load kernel modules
+- Can modify kernel parameters (sysctl)
+- Can easily escape to the host system
+- Bypass ALL container security boundaries
+
+Privileged mode should ONLY be used for:
+- System-level workloads (CNI plugins, storage drivers)
+- Containers that truly need host-level access
+
+For most applications, this is unnecessary and creates severe security risks.
+""".strip()
+
+_PRIVILEGED_REMEDIATION = """
+Remove privileged mode from your container:
+
+# BEFORE (Insecure):
+securityContext:
+  privileged: true    # ❌ REMOVE THIS
+
+# AFTER (Secure):
+securityContext:
+  privileged: false   # ✅ Or omit entirely (defaults to false)
+  allowPrivilegeEscalation: false
+  runAsNonRoot: true
+  capabilities:
+    drop:
+      - ALL
+    add:
+      - NET_BIND_SERVICE  # Only add specific capabilities you need
+
+If you need specific capabilities, use 'capabilities.add' instead 
+of privileged mode. For example:
+- NET_ADMIN for network configuration
+- SYS_TIME for clock adjustments
+- NET_BIND_SERVICE for binding to ports < 1024
+""".strip()
+
+
 class PrivilegedScanner(BaseScanner):
     """
     Scans for containers running in privileged mode
@@ -17,6 +64,16 @@ class PrivilegedScanner(BaseScanner):
     - Can modify kernel parameters
     - Easy container escape to host
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.1",      # Minimize privileged containers
+        "PCI-DSS-2.2",    # Security configurations
+        "NIST-800-190"    # Container security
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -28,22 +85,33 @@ class PrivilegedScanner(BaseScanner):
         Returns:
             List of findings for privileged containers
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        # Check each container
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check if privileged mode is enabled
-            if container.security_context and container.security_context.privileged:
-                findings.append(self._create_privileged_finding(
-                    pod_name, namespace, container_name
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for privileged mode
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        sc = container.security_context
+        if sc and sc.privileged:
+            return (self._create_privileged_finding(
+                ctx[0], ctx[1], container.name
+            ),)
+        return ()
     
     def _create_privileged_finding(
         self,
@@ -59,53 +127,8 @@ class PrivilegedScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Container running in privileged mode",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' is running with privileged: true.
-
-This is EXTREMELY DANGEROUS because privileged containers:
-- Have ALL Linux capabilities (CAP_SYS_ADMIN, etc.)
-- Can access ALL host devices (/dev/*)
-- Can load kernel modules
-- Can modify kernel parameters (sysctl)
-- Can easily escape to the host system
-- Bypass ALL container security boundaries
-
-Privileged mode should ONLY be used for:
-- System-level workloads (CNI plugins, storage drivers)
-- Containers that truly need host-level access
-
-For most applications, this is unnecessary and creates severe security risks.
-""".strip(),
-            remediation="""
-Remove privileged mode from your container:
-
-# BEFORE (Insecure):
-securityContext:
-  privileged: true    # ❌ REMOVE THIS
-
-# AFTER (Secure):
-securityContext:
-  privileged: false   # ✅ Or omit entirely (defaults to false)
-  allowPrivilegeEscalation: false
-  runAsNonRoot: true
-  capabilities:
-    drop:
-      - ALL
-    add:
-      - NET_BIND_SERVICE  # Only add specific capabilities you need
-
-If you need specific capabilities, use 'capabilities.add' instead 
-of privileged mode. For example:
-- NET_ADMIN for network configuration
-- SYS_TIME for clock adjustments
-- NET_BIND_SERVICE for binding to ports < 1024
-""".strip(),
-            compliance=[
-                "CIS-5.2.1",      # Minimize privileged containers
-                "PCI-DSS-2.2",    # Security configurations
-                "NIST-800-190"    # Container security
-            ]
+            description=(_PRIVILEGED_DESCRIPTION, (container_name, pod_name)),
+            remediation=_PRIVILEGED_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
@@ -7,6 +7,58 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_READONLY_DESCRIPTION = """
+Container '{0}' in pod '{1}' has a writable root filesystem.
+
+Reason: {2}
+
+Writable filesystems allow attackers to:
+- Modify application binaries and libraries
+- Install malware or backdoors
+- Create persistence mechanisms
+- Tamper with configuration files
+- Plant rootkits
+
+Read-only filesystems provide defense-in-depth by preventing 
+unauthorized file modifications, even if the container is compromised.
+
+Best practice: Use read-only root filesystems and mount writable 
+volumes only where necessary (logs, cache, temp files).
+""".strip()
+
+_READONLY_REMEDIATION = """
+Set the root filesystem to read-only:
+
+securityContext:
+  readOnlyRootFilesystem: true  # ✅ Enable this
+
+# If your app needs to write to specific directories:
+volumeMounts:
+  - name: tmp
+    mountPath: /tmp         # Writable temp directory
+  - name: cache
+    mountPath: /var/cache   # Writable cache directory
+
+volumes:
+  - name: tmp
+    emptyDir: {}           # Ephemeral writable volume
+  - name: cache
+    emptyDir: {}
+
+This allows writes only to explicitly mounted volumes, 
+while keeping the root filesystem immutable.
+
+Common directories that need to be writable:
+- /tmp
+- /var/cache
+- /var/log
+- /var/run
+""".strip()
+
+
 class ReadOnlyFilesystemScanner(BaseScanner):
     """
     Scans for containers without read-only root filesystems
@@ -16,6 +68,16 @@ class ReadOnlyFilesystemScanner(BaseScanner):
     - Malware persistence
     - Unauthorized file changes
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.6",
+        "NIST-800-190",
+        "PCI-DSS-2.2.5"
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -27,32 +89,43 @@ class ReadOnlyFilesystemScanner(BaseScanner):
         Returns:
             List of findings for writable filesystems
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check security context
-            if container.security_context:
-                read_only_fs = container.security_context.read_only_root_filesystem
-                
-                # If not set or explicitly False
-                if read_only_fs is None or read_only_fs is False:
-                    findings.append(self._create_readonly_finding(
-                        pod_name, namespace, container_name,
-                        read_only_fs is False
-                    ))
-            else:
-                # No security context - defaults to writable
-                findings.append(self._create_readonly_finding(
-                    pod_name, namespace, container_name,
-                    False
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for a writable root filesystem
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        sc = container.security_context
+        if sc:
+            read_only_fs = sc.read_only_root_filesystem
+
+            # If not set or explicitly False
+            if read_only_fs is None or read_only_fs is False:
+                return (self._create_readonly_finding(
+                    ctx[0], ctx[1], container.name,
+                    read_only_fs is False
+                ),)
+            return ()
+
+        # No security context - defaults to writable
+        return (self._create_readonly_finding(
+            ctx[0], ctx[1], container.name, False
+        ),)
     
     def _create_readonly_finding(
         self,
@@ -74,58 +147,8 @@ class ReadOnlyFilesystemScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Root filesystem is writable",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has a writable root filesystem.
-
-Reason: {reason}
-
-Writable filesystems allow attackers to:
-- Modify application binaries and libraries
-- Install malware or backdoors
-- Create persistence mechanisms
-- Tamper with configuration files
-- Plant rootkits
-
-Read-only filesystems provide defense-in-depth by preventing 
-unauthorized file modifications, even if the container is compromised.
-
-Best practice: Use read-only root filesystems and mount writable 
-volumes only where necessary (logs, cache, temp files).
-""".strip(),
-            remediation="""
-Set the root filesystem to read-only:
-
-securityContext:
-  readOnlyRootFilesystem: true  # ✅ Enable this
-
-# If your app needs to write to specific directories:
-volumeMounts:
-  - name: tmp
-    mountPath: /tmp         # Writable temp directory
-  - name: cache
-    mountPath: /var/cache   # Writable cache directory
-
-volumes:
-  - name: tmp
-    emptyDir: {}           # Ephemeral writable volume
-  - name: cache
-    emptyDir: {}
-
-This allows writes only to explicitly mounted volumes, 
-while keeping the root filesystem immutable.
-
-Common directories that need to be writable:
-- /tmp
-- /var/cache
-- /var/log
-- /var/run
-""".strip(),
-            compliance=[
-                "CIS-5.2.6",
-                "NIST-800-190",
-                "PCI-DSS-2.2.5"
-            ]
+            description=(_READONLY_DESCRIPTION, (container_name, pod_name, reason)),
+            remediation=_READONLY_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
@@ -7,78 +7,13 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
-class ResourceRequestsScanner(BaseScanner):
-    """
-    Scans for containers without resource requests
-    
-    Missing requests cause:
-    - Poor scheduling decisions
-    - Oversubscribed nodes
-    - Performance issues
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if containers have resource requests
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for containers without requests
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            missing_requests = []
-            
-            if container.resources:
-                if container.resources.requests:
-                    # Check individual requests
-                    if container.resources.requests.get('cpu') is None:
-                        missing_requests.append('cpu')
-                    if container.resources.requests.get('memory') is None:
-                        missing_requests.append('memory')
-                else:
-                    # No requests section
-                    missing_requests = ['cpu', 'memory']
-            else:
-                # No resources section
-                missing_requests = ['cpu', 'memory']
-            
-            if missing_requests:
-                findings.append(self._create_requests_finding(
-                    pod_name, namespace, container_name, missing_requests
-                ))
-        
-        return findings
-    
-    def _create_requests_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        container_name: str,
-        missing: List[str]
-    ) -> Dict[str, Any]:
-        """Create finding for missing resource requests"""
-        
-        missing_str = " and ".join(missing)
-        
-        return self.create_finding(
-            severity="MEDIUM",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=container_name,
-            issue=f"Missing resource requests: {missing_str}",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' is missing resource requests.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_REQUESTS_DESCRIPTION = """
+Container '{0}' in pod '{1}' is missing resource requests.
 
-Missing: {missing_str}
+Missing: {2}
 
 Resource requests tell the scheduler:
 - How much CPU/memory to guarantee
@@ -97,8 +32,9 @@ Requests vs Limits:
 - LIMITS: Maximum allowed resources
 
 Best practice: Always set BOTH requests AND limits.
-""".strip(),
-            remediation="""
+""".strip()
+
+_REQUESTS_REMEDIATION = """
 Add resource requests to your container:
 
 resources:
@@ -122,13 +58,110 @@ requests:
 limits:
   cpu: "500m"
   memory: "512Mi"
-""".strip(),
-            compliance=[
-                "CIS-5.2.9",
-                "Resource Management Best Practices",
-                "Kubernetes QoS Classes"
-            ]
+""".strip()
+
+
+# Which requests were absent, keyed on (no cpu, no memory) - the
+# domain has three values, so the joined text and the issue titles
+# are built once instead of per finding
+_MISSING_STRS = {
+    (True, False): "cpu",
+    (False, True): "memory",
+    (True, True): "cpu and memory",
+}
+
+_REQUESTS_ISSUES = {
+    text: "Missing resource requests: " + text
+    for text in _MISSING_STRS.values()
+}
+
+
+class ResourceRequestsScanner(BaseScanner):
+    """
+    Scans for containers without resource requests
+    
+    Missing requests cause:
+    - Poor scheduling decisions
+    - Oversubscribed nodes
+    - Performance issues
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "resource_management"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.9",
+        "Resource Management Best Practices",
+        "Kubernetes QoS Classes"
+    )
+    
+    def scan(self, pod) -> List[Dict[str, Any]]:
+        """
+        Check if containers have resource requests
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for containers without requests
+        """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
+        findings = []
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
+        return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for missing resource requests
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        # One walk down the resources chain per container
+        resources = container.resources
+        requests = resources.requests if resources else None
+        if requests:
+            # Check individual requests
+            no_cpu = requests.get('cpu') is None
+            no_memory = requests.get('memory') is None
+            if not (no_cpu or no_memory):
+                return ()
+            missing_str = _MISSING_STRS[(no_cpu, no_memory)]
+        else:
+            # No resources/requests section
+            missing_str = "cpu and memory"
+
+        return (self._create_requests_finding(
+            ctx[0], ctx[1], container.name, missing_str
+        ),)
+    
+    def _create_requests_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: str,
+        missing_str: str
+    ) -> Dict[str, Any]:
+        """Create finding for missing resource requests"""
+
+        return self.create_finding(
+            severity="MEDIUM",
+            pod_name=pod_name,
+            namespace=namespace,
+            container_name=container_name,
+            issue=_REQUESTS_ISSUES[missing_str],
+            description=(_REQUESTS_DESCRIPTION, (container_name, pod_name, missing_str)),
+            remediation=_REQUESTS_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "resource_management"
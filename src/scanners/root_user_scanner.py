@@ -7,6 +7,44 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_ROOT_DESCRIPTION = """
+Container '{0}' in pod '{1}' is running as root (UID 0).
+
+Reason: {2}
+
+This is a critical security risk because:
+- If the container is compromised, attackers gain root privileges
+- Root can modify system files and configurations
+- Increases the risk of container escape attacks
+- Violates the principle of least privilege
+
+Best practice: Always run containers as non-root users.
+""".strip()
+
+_ROOT_REMEDIATION = """
+Add security context to your pod spec:
+
+spec:
+  securityContext:
+    runAsNonRoot: true
+    runAsUser: 1000      # Use a non-root UID
+    runAsGroup: 3000
+    fsGroup: 2000
+  containers:
+  - name: your-container
+    securityContext:
+      allowPrivilegeEscalation: false
+      runAsNonRoot: true
+      runAsUser: 1000
+
+If your application requires specific permissions, use capabilities
+instead of running as root.
+""".strip()
+
+
 class RootUserScanner(BaseScanner):
     """
     Scans for containers running as root user
@@ -16,6 +54,16 @@ class RootUserScanner(BaseScanner):
     - Can modify system files inside container
     - Increases attack surface for container escape
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.2.6",      # CIS Kubernetes Benchmark
+        "PCI-DSS-2.2.5",  # PCI DSS
+        "NIST-800-190"    # NIST Container Security
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
@@ -27,48 +75,49 @@ class RootUserScanner(BaseScanner):
         Returns:
             List of findings for containers running as root
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        # Check each container in the pod
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            # Check security context
-            if container.security_context:
-                run_as_user = container.security_context.run_as_user
-                run_as_non_root = container.security_context.run_as_non_root
-                
-                # If explicitly set to root (UID 0)
-                if run_as_user == 0:
-                    findings.append(self._create_root_finding(
-                        pod_name, namespace, container_name, 
-                        "Explicitly running as root (runAsUser: 0)"
-                    ))
-                
-                # If runAsNonRoot is not set or is False
-                elif run_as_non_root is None or run_as_non_root is False:
-                    # Check pod-level security context
-                    pod_run_as_user = None
-                    if pod.spec.security_context:
-                        pod_run_as_user = pod.spec.security_context.run_as_user
-                    
-                    # If pod level also allows root
-                    if pod_run_as_user is None or pod_run_as_user == 0:
-                        findings.append(self._create_root_finding(
-                            pod_name, namespace, container_name,
-                            "Not enforcing non-root user (runAsNonRoot not set)"
-                        ))
-            else:
-                # No security context at all - defaults to root
-                findings.append(self._create_root_finding(
-                    pod_name, namespace, container_name,
-                    "No security context defined (defaults to root)"
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for root-user execution
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        sc = container.security_context
+        if sc:
+            # If explicitly set to root (UID 0)
+            if sc.run_as_user == 0:
+                reason = "Explicitly running as root (runAsUser: 0)"
+            elif sc.run_as_non_root:
+                return ()
+            else:
+                # runAsNonRoot not enforced here - only flag when the
+                # pod level also allows root
+                pod_sc = ctx[2].security_context
+                pod_run_as_user = pod_sc.run_as_user if pod_sc else None
+                if pod_run_as_user is not None and pod_run_as_user != 0:
+                    return ()
+                reason = "Not enforcing non-root user (runAsNonRoot not set)"
+        else:
+            # No security context at all - defaults to root
+            reason = "No security context defined (defaults to root)"
+
+        return (self._create_root_finding(
+            ctx[0], ctx[1], container.name, reason
+        ),)
     
     def _create_root_finding(
         self, 
@@ -84,45 +133,9 @@ class RootUserScanner(BaseScanner):
             pod_name=pod_name,
             namespace=namespace,
             container_name=container_name,
-            issue=f"Container running as root user",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' is running as root (UID 0).
-
-Reason: {reason}
-
-This is a critical security risk because:
-- If the container is compromised, attackers gain root privileges
-- Root can modify system files and configurations
-- Increases the risk of container escape attacks
-- Violates the principle of least privilege
-
-Best practice: Always run containers as non-root users.
-""".strip(),
-            remediation="""
-Add security context to your pod spec:
-
-spec:
-  securityContext:
-    runAsNonRoot: true
-    runAsUser: 1000      # Use a non-root UID
-    runAsGroup: 3000
-    fsGroup: 2000
-  containers:
-  - name: your-container
-    securityContext:
-      allowPrivilegeEscalation: false
-      runAsNonRoot: true
-      runAsUser: 1000
-
-If your application requires specific permissions, use capabilities 
-instead of running as root.
-""".strip(),
-            compliance=[
-                "CIS-5.2.6",      # CIS Kubernetes Benchmark
-                "PCI-DSS-2.2.5",  # PCI DSS
-                "NIST-800-190"    # NIST Container Security
-            ]
+            issue="Container running as root user",
+            description=(_ROOT_DESCRIPTION, (container_name, pod_name, reason)),
+            remediation=_ROOT_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
@@ -7,64 +7,11 @@ from typing import List, Dict, Any
 from .base_scanner import BaseScanner
 
 
-class SeccompScanner(BaseScanner):
-    """
-    Scans for missing seccomp profiles
-    
-    Seccomp restricts system calls a container can make.
-    """
-    
-    def scan(self, pod) -> List[Dict[str, Any]]:
-        """
-        Check if containers have seccomp profiles
-        
-        Args:
-            pod: Kubernetes pod object
-            
-        Returns:
-            List of findings for missing seccomp
-        """
-        findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            
-            has_seccomp = False
-            
-            # Check container-level seccomp
-            if container.security_context and container.security_context.seccomp_profile:
-                has_seccomp = True
-            
-            # Check pod-level seccomp
-            elif pod.spec.security_context and pod.spec.security_context.seccomp_profile:
-                has_seccomp = True
-            
-            if not has_seccomp:
-                findings.append(self._create_seccomp_finding(
-                    pod_name, namespace, container_name
-                ))
-        
-        return findings
-    
-    def _create_seccomp_finding(
-        self,
-        pod_name: str,
-        namespace: str,
-        container_name: str
-    ) -> Dict[str, Any]:
-        """Create finding for missing seccomp"""
-        
-        return self.create_finding(
-            severity="LOW",
-            pod_name=pod_name,
-            namespace=namespace,
-            container_name=container_name,
-            issue="No seccomp profile defined",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' has no seccomp profile.
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_SECCOMP_DESCRIPTION = """
+Container '{0}' in pod '{1}' has no seccomp profile.
 
 Seccomp (Secure Computing Mode) restricts system calls.
 
@@ -86,8 +33,9 @@ Example blocked syscalls:
 - perf_event_open()
 
 Most applications work fine with RuntimeDefault profile.
-""".strip(),
-            remediation="""
+""".strip()
+
+_SECCOMP_REMEDIATION = """
 Add seccomp profile:
 
 # Container-level (recommended):
@@ -120,12 +68,85 @@ Recommendation:
 3. Create custom profile only if needed
 
 99% of apps work with RuntimeDefault!
-""".strip(),
-            compliance=[
-                "CIS-5.7.2",
-                "System Call Filtering"
-            ]
+""".strip()
+
+
+class SeccompScanner(BaseScanner):
+    """
+    Scans for missing seccomp profiles
+    
+    Seccomp restricts system calls a container can make.
+    """
+
+    # Finding category for this scanner's records
+    CATEGORY = "pod_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.7.2",
+        "System Call Filtering"
+    )
+    
+    def scan(self, pod) -> List[Dict[str, Any]]:
+        """
+        Check if containers have seccomp profiles
+        
+        Args:
+            pod: Kubernetes pod object
+            
+        Returns:
+            List of findings for missing seccomp
+        """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
+        findings = []
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
+        return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for a missing seccomp profile
+
+        Pod-level seccomp applies to every container, so either level
+        defining a profile satisfies the check.
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        sc = container.security_context
+        if sc and sc.seccomp_profile:
+            return ()
+        pod_sc = ctx[2].security_context
+        if pod_sc and pod_sc.seccomp_profile:
+            return ()
+        return (self._create_seccomp_finding(
+            ctx[0], ctx[1], container.name
+        ),)
+    
+    def _create_seccomp_finding(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: str
+    ) -> Dict[str, Any]:
+        """Create finding for missing seccomp"""
+        
+        return self.create_finding(
+            severity="LOW",
+            pod_name=pod_name,
+            namespace=namespace,
+            container_name=container_name,
+            issue="No seccomp profile defined",
+            description=(_SECCOMP_DESCRIPTION, (container_name, pod_name)),
+            remediation=_SECCOMP_REMEDIATION,
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self) -> str:
-        return "pod_security"
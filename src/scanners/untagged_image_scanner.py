@@ -5,6 +5,39 @@ Detects containers with no image tag specified
 
 from typing import List, Dict, Any
 from .base_scanner import BaseScanner
+from .image_ref import parse_image
+
+
+# Finding text lives in shared module-level templates - static
+# boilerplate is allocated once, and dynamic fields are formatted
+# lazily via render_text only when a reporter shows the finding
+_UNTAGGED_DESCRIPTION = """
+Container '{0}' in pod '{1}' uses an image without a tag.
+
+Image: {2}
+
+When no tag is specified, Kubernetes defaults to :latest.
+
+This is dangerous because:
+- You don't know what version is running
+- Different nodes may pull different versions
+- No reproducibility
+- No guaranteed rollback
+""".strip()
+
+_UNTAGGED_REMEDIATION = """
+Specify a version tag explicitly:
+
+# BEFORE:
+image: {0}
+
+# AFTER:
+image: {0}:1.21.6
+# OR:
+image: {0}:stable
+# OR:
+image: {0}@sha256:abc123...
+""".strip()
 
 
 class UntaggedImageScanner(BaseScanner):
@@ -13,27 +46,52 @@ class UntaggedImageScanner(BaseScanner):
     
     No tag defaults to :latest (even worse!)
     """
+
+    # Finding category for this scanner's records
+    CATEGORY = "image_security"
+
+    # Shared compliance tuple - no per-finding list allocation
+    _COMPLIANCE = (
+        "CIS-5.4.1",
+        "Image Security Best Practices",
+        "Configuration Management"
+    )
     
     def scan(self, pod) -> List[Dict[str, Any]]:
         """
         Check if containers have image tags
         """
+        metadata = pod.metadata
+        spec = pod.spec
+        ctx = (metadata.name, metadata.namespace, spec)
+
         findings = []
-        
-        pod_name = pod.metadata.name
-        namespace = pod.metadata.namespace
-        
-        for container in pod.spec.containers:
-            container_name = container.name
-            image = container.image
-            
-            # Check if image has no tag or digest
-            if ':' not in image and '@' not in image:
-                findings.append(self._create_untagged_finding(
-                    pod_name, namespace, container_name, image
-                ))
-        
+        for container in spec.containers:
+            findings.extend(self.check_container(container, ctx))
+
         return findings
+
+    def check_container(self, container, ctx) -> List[Dict[str, Any]]:
+        """
+        Check one container for an image without tag or digest
+
+        Args:
+            container: Container spec object
+            ctx: Tuple of (pod_name, namespace, pod spec)
+
+        Returns:
+            Findings for this container
+        """
+        image = container.image
+
+        # The parsed view only reads the tag position, so a registry
+        # port (reg:5000/app) no longer masks a missing tag
+        ref = parse_image(image)
+        if not ref.tag and not ref.digest:
+            return (self._create_untagged_finding(
+                ctx[0], ctx[1], container.name, image
+            ),)
+        return ()
     
     def _create_untagged_finding(self, pod_name, namespace, container_name, image):
         
@@ -43,38 +101,8 @@ class UntaggedImageScanner(BaseScanner):
             namespace=namespace,
             container_name=container_name,
             issue="Image has no tag specified",
-            description=f"""
-Container '{container_name}' in pod '{pod_name}' uses an image without a tag.
-
-Image: {image}
-
-When no tag is specified, Kubernetes defaults to :latest.
-
-This is dangerous because:
-- You don't know what version is running
-- Different nodes may pull different versions
-- No reproducibility
-- No guaranteed rollback
-""".strip(),
-            remediation=f"""
-Specify a version tag explicitly:
-
-# BEFORE:
-image: {image}
-
-# AFTER:
-image: {image}:1.21.6
-# OR:
-image: {image}:stable
-# OR:
-image: {image}@sha256:abc123...
-""".strip(),
-            compliance=[
-                "CIS-5.4.1",
-                "Image Security Best Practices",
-                "Configuration Management"
-            ]
+            description=(_UNTAGGED_DESCRIPTION, (container_name, pod_name, image)),
+            remediation=(_UNTAGGED_REMEDIATION, (image,)),
+            compliance=self._COMPLIANCE
         )
     
-    def _get_category(self):
-        return "image_security"
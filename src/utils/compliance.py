@@ -7,6 +7,22 @@ from typing import List, Dict, Any
 from collections import defaultdict
 
 
+# Memoized compliance-ref -> framework prefix extraction. The refs are
+# a small fixed vocabulary shared across findings (the scanners hand
+# out the same class-level tuples), so after warm-up every lookup is a
+# dict hit instead of a string split.
+_framework_cache = {}
+
+
+def _framework_of(ref: str) -> str:
+    """Extract the framework prefix of a ref ("CIS-5.2.1" -> "CIS")"""
+    framework = _framework_cache.get(ref)
+    if framework is None:
+        framework = ref.split('-')[0] if '-' in ref else ref
+        _framework_cache[ref] = framework
+    return framework
+
+
 class ComplianceMapper:
     """
     Maps security findings to compliance frameworks
@@ -35,28 +51,40 @@ class ComplianceMapper:
         Returns:
             Compliance analysis summary
         """
-        # Group findings by compliance framework
+        # Group findings by compliance framework, tallying CRITICAL and
+        # HIGH counts in the same pass instead of re-scanning each
+        # framework's violation list afterwards
         framework_violations = defaultdict(list)
-        
+        critical_counts = defaultdict(int)
+        high_counts = defaultdict(int)
+
         for finding in findings:
             compliance_refs = finding.get('compliance', [])
+            if not compliance_refs:
+                continue
+            # Hoist the per-finding fields out of the refs loop
+            issue = finding['issue']
+            severity = finding['severity']
+            pod = finding['pod_name']
             for ref in compliance_refs:
-                # Extract framework prefix (e.g., "CIS-5.2.1" -> "CIS")
-                framework = ref.split('-')[0] if '-' in ref else ref
+                framework = _framework_of(ref)
                 framework_violations[framework].append({
                     'reference': ref,
-                    'issue': finding['issue'],
-                    'severity': finding['severity'],
-                    'pod': finding['pod_name']
+                    'issue': issue,
+                    'severity': severity,
+                    'pod': pod
                 })
-        
+                if severity == 'CRITICAL':
+                    critical_counts[framework] += 1
+                elif severity == 'HIGH':
+                    high_counts[framework] += 1
+
         # Calculate compliance scores per framework
         framework_scores = {}
         for framework, violations in framework_violations.items():
-            # Count by severity
-            critical = sum(1 for v in violations if v['severity'] == 'CRITICAL')
-            high = sum(1 for v in violations if v['severity'] == 'HIGH')
-            
+            critical = critical_counts[framework]
+            high = high_counts[framework]
+
             # Simple compliance calculation
             # More critical issues = lower compliance
             if critical > 0:
@@ -0,0 +1,115 @@
+"""
+Pod View
+Lightweight attribute view over raw pod JSON
+
+The kubernetes client normally deserializes every pod into a tree of
+swagger model objects, which dominates decode cost on large LISTs.
+PodView wraps the raw (camelCase) JSON dict instead and translates the
+snake_case attribute access used by the scanners on the fly, so model
+construction can be skipped entirely.
+
+One view per pod is shared by every scanner in the fused pass, and
+child views are memoized per attribute, so each field of the pod tree
+is converted at most once per scan no matter how many scanners read it.
+"""
+
+# JSON keys that don't follow the plain snake -> camelCase convention
+_CAMEL_OVERRIDES = {
+    'host_ipc': 'hostIPC',
+    'host_pid': 'hostPID',
+}
+
+# Cache of snake_case -> camelCase translations (the set of attribute
+# names the scanners use is small, so this stays tiny)
+_camel_cache = {}
+
+
+def _to_camel(name):
+    """Convert a snake_case attribute name to its JSON camelCase key"""
+    key = _camel_cache.get(name)
+    if key is None:
+        override = _CAMEL_OVERRIDES.get(name)
+        if override:
+            key = override
+        else:
+            parts = name.split('_')
+            key = parts[0] + ''.join(part.title() for part in parts[1:])
+        _camel_cache[name] = key
+    return key
+
+
+def _wrap(value):
+    """Wrap dicts in PodView, recurse into lists, pass scalars through"""
+    if isinstance(value, dict):
+        return PodView(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    return value
+
+
+class PodView:
+    """
+    Read-only view over a parsed pod JSON object
+
+    Supports the same snake_case attribute access as the kubernetes
+    client models (pod.spec.containers, ctx.run_as_user, ...) plus the
+    dict protocol for map-valued fields like resource limits and
+    annotations (limits.get('memory'), key in annotations). Missing
+    fields resolve to None, matching unset model attributes.
+    """
+
+    __slots__ = ('_data', '_views')
+
+    def __init__(self, data):
+        self._data = data
+        self._views = {}
+
+    def __getattr__(self, name):
+        # Memoize wrapped children - scanners hit pod.spec and
+        # container.security_context repeatedly, and without the cache
+        # each access rebuilds the child view (and, for containers, the
+        # whole list of views). The view is read-only, so one wrapped
+        # object per field is always safe to hand back.
+        views = self._views
+        try:
+            return views[name]
+        except KeyError:
+            pass
+        try:
+            value = self._data[_to_camel(name)]
+        except KeyError:
+            view = None
+        else:
+            view = _wrap(value)
+        views[name] = view
+        return view
+
+    # Map-valued fields (annotations, resource limits/requests) are
+    # consumed through the dict protocol - delegate to the raw dict.
+    def get(self, key, default=None):
+        return _wrap(self._data.get(key, default))
+
+    def __getitem__(self, key):
+        return _wrap(self._data[key])
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __bool__(self):
+        return bool(self._data)
+
+    def keys(self):
+        return self._data.keys()
+
+    def to_dict(self):
+        """Return the underlying raw dict"""
+        return self._data
+
+    def __repr__(self):
+        return f"PodView({self._data!r})"
@@ -3,6 +3,9 @@ Scanner Manager
 Coordinates running multiple scanners
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List, Dict, Any
 from src.scanners import (
     RootUserScanner,
@@ -17,15 +20,19 @@ from src.scanners.latest_tag_scanner import LatestTagScanner
 from src.scanners.untagged_image_scanner import UntaggedImageScanner
 from src.scanners.image_registry_scanner import ImageRegistryScanner
 from src.scanners.secrets_in_env_scanner import SecretsInEnvScanner
-from src.scanners.host_network_scanner import HostNetworkScanner
+from src.scanners.host_isolation_scanner import HostIsolationScanner
 from src.scanners.host_path_scanner import HostPathScanner
-from src.scanners.host_namespaces_scanner import HostNamespacesScanner
 from src.scanners.capabilities_scanner import CapabilitiesScanner
 from src.scanners.default_service_account_scanner import DefaultServiceAccountScanner
 from src.scanners.missing_security_context_scanner import MissingSecurityContextScanner
 from src.scanners.automount_token_scanner import AutomountTokenScanner
 from src.scanners.apparmor_selinux_scanner import AppArmorSELinuxScanner
 from src.scanners.seccomp_scanner import SeccompScanner
+from src.scanners.base_scanner import _SEV_RANK, ScanCache, scan_all, should_skip
+
+# Default worker count for parallel scans, overridable via the
+# MAX_PARALLELISM environment variable (kubei convention)
+_MAX_PARALLELISM = int(os.environ.get('MAX_PARALLELISM', '8'))
 
 
 class ScannerManager:
@@ -33,7 +40,12 @@ class ScannerManager:
     Manages and runs all security scanners
     """
     
-    def __init__(self):
+    def __init__(self, min_severity: str = 'LOW'):
+        """
+        Args:
+            min_severity: Lowest severity to report; passed to every
+                scanner so filtered findings are never constructed
+        """
         # Initialize all scanners
         self.scanners = [
             # Pod Security (Day 2)
@@ -54,9 +66,8 @@ class ScannerManager:
             
             # Secrets & Network Security (Day 4)
             SecretsInEnvScanner(),
-            HostNetworkScanner(),
+            HostIsolationScanner(),
             HostPathScanner(),
-            HostNamespacesScanner(),
             
             # Advanced Security (Day 5)
             CapabilitiesScanner(),
@@ -66,6 +77,12 @@ class ScannerManager:
             AppArmorSELinuxScanner(),
             SeccompScanner(),
         ]
+        if min_severity != 'LOW':
+            for scanner in self.scanners:
+                scanner._min_rank = _SEV_RANK[min_severity]
+        # Serves repeat scans of unchanged pods from memory; a pod's
+        # (uid, resourceVersion) pair changes on every mutation
+        self._cache = ScanCache()
     
     def scan_pod(self, pod) -> List[Dict[str, Any]]:
         """
@@ -77,46 +94,165 @@ class ScannerManager:
         Returns:
             List of all findings from all scanners
         """
-        all_findings = []
-        
-        for scanner in self.scanners:
-            findings = scanner.scan(pod)
-            all_findings.extend(findings)
-        
-        return all_findings
+        metadata = pod.metadata
+
+        # Exempt pods are rejected before any scanner runs - system
+        # namespaces and annotated opt-outs only generate noise
+        if should_skip(metadata):
+            return []
+
+        uid = metadata.uid
+        if uid is not None:
+            cached = self._cache.get(uid, metadata.resource_version)
+            if cached is not None:
+                return cached
+
+        # scan_all walks the pod model once for every scanner that
+        # implements the fused check hooks; the None entries it may
+        # contain are findings suppressed by the severity threshold
+        findings = [f for f in scan_all(pod, self.scanners) if f is not None]
+
+        if uid is not None:
+            self._cache.put(uid, metadata.resource_version, findings)
+        return findings
     
-    def scan_pods(self, pods) -> Dict[str, Any]:
+    def scan_pods_parallel(self, pods, workers: int = None):
+        """
+        Scan pods concurrently on a thread pool
+
+        Pods are independent and the scanners keep no shared mutable
+        state, so per-pod scans dispatch safely across worker
+        threads. Findings stream back flattened, in pod order.
+
+        Args:
+            pods: Iterable of Kubernetes pod objects
+            workers: Thread pool size; defaults to MAX_PARALLELISM
+                from the environment (8 when unset)
+
+        Yields:
+            Findings, one at a time
+        """
+        if workers is None:
+            workers = _MAX_PARALLELISM
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from chain.from_iterable(executor.map(self.scan_pod, pods))
+
+    def iter_findings(self, pods):
+        """
+        Stream findings across pods as they are produced
+
+        Pipeline-fusion entry point: nothing beyond the current pod's
+        findings is buffered, so a consumer can write each finding
+        out as it arrives regardless of cluster size.
+
+        Args:
+            pods: Iterable of Kubernetes pod objects
+
+        Yields:
+            Findings, one at a time
+        """
+        for pod in pods:
+            yield from self.scan_pod(pod)
+
+    def invalidate(self, uid):
+        """
+        Drop cached findings for a pod, e.g. on a delete event
+
+        Args:
+            uid: The pod's metadata.uid
+        """
+        self._cache.invalidate(uid)
+
+    def scan_from_cache(self, pod_lister):
+        """
+        Stream findings for pods served by a client-side cache
+
+        Accepts any lister with a .list() method - an informer-style
+        store, or a wrapper over a watch-cache LIST - so callers that
+        maintain a local pod cache never materialize a second list
+        just to hand it to the scanner. Combined with the
+        (uid, resourceVersion) scan cache, steady-state re-scans only
+        pay for pods that actually changed.
+
+        Args:
+            pod_lister: Object whose .list() returns an iterable of
+                pod objects
+
+        Yields:
+            Findings, one at a time
+        """
+        yield from self.iter_findings(pod_lister.list())
+
+    def scan_pods_iter(self, pods, workers: int = 1):
+        """
+        Run all scanners over pods, yielding per-pod results
+
+        Lets callers aggregate scores and severity buckets in a single
+        traversal instead of re-walking the pods or findings. With
+        workers > 1 the per-pod scans dispatch onto a thread pool;
+        executor.map keeps results in pod order either way.
+
+        Args:
+            pods: Iterable of Kubernetes pod objects
+            workers: Thread pool size; 1 (the default) scans inline
+
+        Yields:
+            Tuples of (pod, findings) as each pod is scanned
+        """
+        if workers > 1:
+            pods = list(pods)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from zip(pods, executor.map(self.scan_pod, pods))
+        else:
+            for pod in pods:
+                yield pod, self.scan_pod(pod)
+
+    def scan_pods(self, pods, workers: int = None) -> Dict[str, Any]:
         """
         Run all scanners on multiple pods
-        
+
         Args:
             pods: List of Kubernetes pod objects
-            
+            workers: Thread pool size for the per-pod scans; defaults
+                to MAX_PARALLELISM from the environment (8 when unset),
+                pass 1 to scan serially for debugging
+
         Returns:
-            Dictionary with findings organized by severity
+            Dictionary with findings organized by severity and by pod UID
         """
+        if workers is None:
+            workers = _MAX_PARALLELISM
         all_findings = []
-        
-        for pod in pods:
-            findings = self.scan_pod(pod)
-            all_findings.extend(findings)
-        
-        # Organize findings by severity
+        findings_by_pod = {}
+
         findings_by_severity = {
             'CRITICAL': [],
             'HIGH': [],
             'MEDIUM': [],
             'LOW': []
         }
-        
-        for finding in all_findings:
-            severity = finding.get('severity', 'LOW')
-            if severity in findings_by_severity:
-                findings_by_severity[severity].append(finding)
-        
+
+        # Bind each bucket's append once so the per-finding dispatch is a
+        # single dict lookup plus a C-level list append, and bucket during
+        # the scan pass instead of re-walking all findings afterwards
+        appenders = {
+            severity: bucket.append
+            for severity, bucket in findings_by_severity.items()
+        }
+
+        for pod, findings in self.scan_pods_iter(pods, workers):
+            findings_by_pod[pod.metadata.uid] = findings
+            all_findings.extend(findings)
+
+            for finding in findings:
+                append = appenders.get(finding.get('severity', 'LOW'))
+                if append is not None:
+                    append(finding)
+
         return {
             'total_findings': len(all_findings),
             'findings_by_severity': findings_by_severity,
+            'findings_by_pod': findings_by_pod,
             'all_findings': all_findings
         }
     
@@ -132,6 +268,6 @@ class ScannerManager:
         """Get count of scanners by category"""
         categories = {}
         for scanner in self.scanners:
-            category = scanner._get_category()
+            category = scanner.CATEGORY
             categories[category] = categories.get(category, 0) + 1
         return categories
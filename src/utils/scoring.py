@@ -3,14 +3,35 @@ Security Scoring Engine
 Calculates security scores for pods, namespaces, and clusters
 """
 
+import re
+from functools import lru_cache
 from typing import List, Dict, Any
 
 
+# Grade thresholds, most severe first; used once below to expand the
+# full lookup table
+_GRADE_BANDS = (
+    (95, 'A+'), (90, 'A'), (85, 'A-'), (80, 'B+'), (75, 'B'),
+    (70, 'B-'), (65, 'C+'), (60, 'C'), (55, 'C-'), (50, 'D'), (0, 'F'),
+)
+
+# Letter grade for every integer score 0-100, precomputed at import -
+# grading becomes one tuple index instead of an 11-branch ladder
+_GRADE_TABLE = tuple(
+    next(grade for floor, grade in _GRADE_BANDS if score >= floor)
+    for score in range(101)
+)
+
+
 class SecurityScorer:
     """
     Calculates security scores based on findings
     """
-    
+
+    # The scorer is stateless - all configuration lives in class
+    # attributes, so instances carry no __dict__ at all
+    __slots__ = ()
+
     # Point deductions by severity
     SEVERITY_WEIGHTS = {
         'CRITICAL': 15,
@@ -26,7 +47,19 @@ class SecurityScorer:
         'Container running in privileged mode': 1.3,
         'Pod using host network': 1.2,
     }
-    
+
+    # The multiplier needles compiled into one case-insensitive
+    # alternation - matching an issue title is a single C-level regex
+    # search instead of a Python loop of substring scans, and the
+    # matched text keys straight into the lowercased multiplier map
+    _ISSUE_MULT_RE = re.compile(
+        '|'.join(re.escape(key) for key in ISSUE_MULTIPLIERS),
+        re.IGNORECASE
+    )
+    _ISSUE_MULT_BY_LOWER = {
+        key.lower(): mult for key, mult in ISSUE_MULTIPLIERS.items()
+    }
+
     def calculate_pod_score(self, findings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate security score for a single pod
@@ -43,6 +76,9 @@ class SecurityScorer:
                 'grade': 'A+',
                 'total_deductions': 0,
                 'findings_count': 0,
+                'severity_breakdown': {
+                    'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0
+                },
                 'risk_level': 'MINIMAL'
             }
         
@@ -55,21 +91,21 @@ class SecurityScorer:
         }
         
         total_deductions = 0
-        
+
+        # Hot loop: lookups bound to locals once per call
+        weight_of = self.SEVERITY_WEIGHTS.get
+        find_multiplier = self._ISSUE_MULT_RE.search
+        multiplier_of = self._ISSUE_MULT_BY_LOWER
         for finding in findings:
             severity = finding.get('severity', 'LOW')
-            issue = finding.get('issue', '')
-            
+
             # Base deduction
-            deduction = self.SEVERITY_WEIGHTS.get(severity, 1)
-            
+            deduction = weight_of(severity, 1)
+
             # Apply multiplier if issue type is extra dangerous
-            multiplier = 1.0
-            for issue_type, mult in self.ISSUE_MULTIPLIERS.items():
-                if issue_type.lower() in issue.lower():
-                    multiplier = mult
-                    break
-            
+            match = find_multiplier(finding.get('issue', ''))
+            multiplier = multiplier_of[match.group(0).lower()] if match else 1.0
+
             total_deductions += deduction * multiplier
             severity_counts[severity] += 1
         
@@ -112,50 +148,43 @@ class SecurityScorer:
                 'pods_at_risk': 0
             }
         
-        # Calculate average score
-        total_score = sum(ps['score'] for ps in pod_scores)
+        # One pass over the scores: total, at-risk and critical counts,
+        # best and worst all accumulate together instead of five
+        # separate walks of the list
+        total_score = 0
+        pods_at_risk = 0      # score < 70
+        critical_pods = 0     # score < 40
+        best_score = worst_score = pod_scores[0]['score']
+
+        for ps in pod_scores:
+            score = ps['score']
+            total_score += score
+            if score < 70:
+                pods_at_risk += 1
+                if score < 40:
+                    critical_pods += 1
+            if score > best_score:
+                best_score = score
+            elif score < worst_score:
+                worst_score = score
+
         avg_score = total_score / len(pod_scores)
-        
-        # Count pods at risk (score < 70)
-        pods_at_risk = sum(1 for ps in pod_scores if ps['score'] < 70)
-        
-        # Count critical pods (score < 40)
-        critical_pods = sum(1 for ps in pod_scores if ps['score'] < 40)
-        
+
         return {
             'average_score': round(avg_score, 1),
             'grade': self._score_to_grade(avg_score),
             'total_pods': len(pod_scores),
             'pods_at_risk': pods_at_risk,
             'critical_pods': critical_pods,
-            'best_score': max(ps['score'] for ps in pod_scores),
-            'worst_score': min(ps['score'] for ps in pod_scores)
+            'best_score': best_score,
+            'worst_score': worst_score
         }
     
     def _score_to_grade(self, score: float) -> str:
         """Convert numeric score to letter grade"""
-        if score >= 95:
-            return 'A+'
-        elif score >= 90:
-            return 'A'
-        elif score >= 85:
-            return 'A-'
-        elif score >= 80:
-            return 'B+'
-        elif score >= 75:
-            return 'B'
-        elif score >= 70:
-            return 'B-'
-        elif score >= 65:
-            return 'C+'
-        elif score >= 60:
-            return 'C'
-        elif score >= 55:
-            return 'C-'
-        elif score >= 50:
-            return 'D'
-        else:
-            return 'F'
+        # Truncating non-negative floats preserves the old comparison
+        # ladder, since every threshold is an integer
+        return _GRADE_TABLE[max(0, min(100, int(score)))]
     
     def _determine_risk_level(self, severity_counts: Dict[str, int]) -> str:
         """
@@ -167,13 +196,19 @@ class SecurityScorer:
         Returns:
             Risk level string
         """
-        if severity_counts['CRITICAL'] >= 3:
+        # Each count is consulted by up to two rungs of the ladder, so
+        # fetch them once up front
+        critical = severity_counts['CRITICAL']
+        high = severity_counts['HIGH']
+        medium = severity_counts['MEDIUM']
+
+        if critical >= 3:
             return 'CRITICAL'
-        elif severity_counts['CRITICAL'] >= 1 or severity_counts['HIGH'] >= 5:
+        elif critical >= 1 or high >= 5:
             return 'HIGH'
-        elif severity_counts['HIGH'] >= 2 or severity_counts['MEDIUM'] >= 8:
+        elif high >= 2 or medium >= 8:
             return 'MODERATE'
-        elif severity_counts['MEDIUM'] >= 3 or severity_counts['LOW'] >= 10:
+        elif medium >= 3 or severity_counts['LOW'] >= 10:
             return 'LOW'
         else:
             return 'MINIMAL'
@@ -193,29 +228,48 @@ class SecurityScorer:
         Returns:
             List of recommendation strings
         """
+        # The text only depends on the critical/high counts and which
+        # score band the pod falls in, and those signatures repeat
+        # across a cluster; memoizing on the 5-point bucket (the 50/70/
+        # 85 thresholds are all multiples of 5) skips rebuilding
+        # identical strings for every similar pod
+        return list(self._recommendations_cached(
+            score // 5,
+            severity_counts['CRITICAL'],
+            severity_counts['HIGH']
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _recommendations_cached(
+        score_bucket: int,
+        critical: int,
+        high: int
+    ) -> tuple:
+        """Build the recommendation tuple for one (bucket, counts) key"""
         recommendations = []
-        
-        if severity_counts['CRITICAL'] > 0:
+
+        if critical > 0:
             recommendations.append(
-                f"🚨 URGENT: Fix {severity_counts['CRITICAL']} CRITICAL "
-                f"issue{'s' if severity_counts['CRITICAL'] > 1 else ''} immediately"
+                f"🚨 URGENT: Fix {critical} CRITICAL "
+                f"issue{'s' if critical > 1 else ''} immediately"
             )
-        
-        if severity_counts['HIGH'] > 0:
+
+        if high > 0:
             recommendations.append(
-                f"⚠️  HIGH Priority: Address {severity_counts['HIGH']} HIGH "
-                f"severity issue{'s' if severity_counts['HIGH'] > 1 else ''}"
+                f"⚠️  HIGH Priority: Address {high} HIGH "
+                f"severity issue{'s' if high > 1 else ''}"
             )
-        
-        if score < 50:
+
+        if score_bucket < 10:
             recommendations.append(
                 "💥 Pod is extremely vulnerable - consider blocking deployment"
             )
-        elif score < 70:
+        elif score_bucket < 14:
             recommendations.append(
                 "⚠️  Pod has significant security issues - remediate before production"
             )
-        elif score < 85:
+        elif score_bucket < 17:
             recommendations.append(
                 "📋 Pod meets minimum security - improvements recommended"
             )
@@ -223,5 +277,5 @@ class SecurityScorer:
             recommendations.append(
                 "✅ Pod has good security posture - minor improvements possible"
             )
-        
-        return recommendations
+
+        return tuple(recommendations)